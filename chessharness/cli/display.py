@@ -4,9 +4,10 @@ Rich-based CLI event consumer.
 This is the ONLY place where terminal output happens.
 It translates GameEvent objects into formatted Rich output.
 
-Future web UI replacement: swap this module for a WebSocket broadcaster
-that serializes events via dataclasses.asdict() and sends JSON to clients.
-The game loop (game.py) requires zero changes.
+The web UI consumes the same events through a WebSocket broadcaster instead
+(chessharness/web/app.py), which serializes each event into a shallow dict
+rather than a dataclasses.asdict() deep copy and sends JSON to clients.
+The game loop (game.py) needs no changes for either consumer.
 """
 
 from __future__ import annotations
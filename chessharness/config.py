@@ -44,12 +44,25 @@ class ProviderConfig:
     bearer_token: str = ""
     models: list[ModelEntry] = field(default_factory=list)
     base_url: str | None = None
+    # id -> ModelEntry, built on first find_model() call; models is not
+    # expected to change after load.
+    _models_by_id: dict[str, ModelEntry] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def auth_token(self) -> str:
         """Prefer bearer_token when present, else fall back to api_key."""
         return self.bearer_token or self.api_key
 
+    def find_model(self, model_id: str) -> ModelEntry | None:
+        """Return the model with this exact id, or None."""
+        if self._models_by_id is None:
+            self._models_by_id = {}
+            for model in self.models:
+                self._models_by_id.setdefault(model.id, model)  # first entry wins
+        return self._models_by_id.get(model_id)
+
 
 @dataclass
 class Config:
@@ -3,7 +3,9 @@ Typed event dataclasses - the shared language between the game loop and any cons
 
 The game loop (game.py) yields these. The CLI, web UI, or test harness consumes them.
 All events are frozen (immutable) so they're safe to pass across async boundaries
-and can be trivially serialized to JSON via dataclasses.asdict().
+and can be trivially serialized to JSON via dataclasses.asdict().  They use
+slots=True: a game yields thousands of them, and none needs a per-instance
+__dict__.
 """
 
 from __future__ import annotations
@@ -27,7 +29,7 @@ GameOverReason = Literal[
 PlayerType = Literal["llm", "human", "engine", "unknown"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameStartEvent:
     white_name: str
     black_name: str
@@ -37,7 +39,7 @@ class GameStartEvent:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TurnStartEvent:
     color: Color
     player_name: str
@@ -49,14 +51,14 @@ class TurnStartEvent:
     player_type: PlayerType = "unknown"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveRequestedEvent:
     color: Color
     attempt_num: int
     player_type: PlayerType = "unknown"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvalidMoveEvent:
     color: Color
     attempted_move: str  # extracted move string that failed validation
@@ -67,7 +69,7 @@ class InvalidMoveEvent:
     provider_metadata: dict[str, object] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveAppliedEvent:
     color: Color
     move_uci: str
@@ -81,19 +83,19 @@ class MoveAppliedEvent:
     provider_metadata: dict[str, object] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReasoningChunkEvent:
     color: Color
     chunk: str   # raw token(s) from the model stream
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckEvent:
     color_in_check: Color
     checking_move_san: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameOverEvent:
     result: GameResult
     reason: GameOverReason
@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from chessharness.events import Color
 
@@ -72,5 +73,13 @@ class Player(ABC):
         """
         ...
 
+    def attach_conversation_log(self, log_dir: Path, game_id: str, color: Color) -> None:
+        """
+        Start a conversation log for this player's game.
+
+        No-op by default: only players that talk to a model have a
+        conversation worth writing down.
+        """
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r})"
@@ -7,15 +7,14 @@ from __future__ import annotations
 import asyncio
 from dataclasses import asdict, dataclass
 import logging
+from pathlib import Path
 import re
-from typing import TYPE_CHECKING
 
+from chessharness.conv_logger import ConversationLogger
+from chessharness.events import Color
 from chessharness.players.base import GameState, MoveResponse, Player
 from chessharness.providers.base import LLMProvider, Message, ProviderError
 
-if TYPE_CHECKING:
-    from chessharness.conv_logger import ConversationLogger
-
 _SYSTEM = """\
 You are playing chess as {color} ({color_upper} pieces) in a standard game.
 
@@ -110,6 +109,14 @@ class LLMPlayer(Player):
         self._reasoning_effort = reasoning_effort
         self._history: list[Message] = []
 
+    def attach_conversation_log(self, log_dir: Path, game_id: str, color: Color) -> None:
+        self._logger = ConversationLogger(
+            log_dir=log_dir,
+            game_id=game_id,
+            player_name=self.name,
+            color=color,
+        )
+
     async def get_move(
         self,
         state: GameState,
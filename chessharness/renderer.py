@@ -58,11 +58,11 @@ def render_png(board: chess.Board, last_move: chess.Move | None = None) -> bytes
     Tries svglib first (pure Python, always works after `uv add svglib reportlab`),
     then falls back to cairosvg if installed.
     """
-    svg_str = render_svg(board, last_move)
+    svg_bytes = render_svg(board, last_move).encode("utf-8")
 
     if _SVGLIB_AVAILABLE and _svg2rlg is not None and _renderPM is not None:
         try:
-            drawing = _svg2rlg(BytesIO(svg_str.encode("utf-8")))
+            drawing = _svg2rlg(BytesIO(svg_bytes))
             if drawing is not None:
                 return _renderPM.drawToString(drawing, fmt="PNG")
         except Exception:
@@ -70,7 +70,7 @@ def render_png(board: chess.Board, last_move: chess.Move | None = None) -> bytes
 
     if _CAIROSVG_AVAILABLE and _cairosvg is not None:
         try:
-            return _cairosvg.svg2png(bytestring=svg_str.encode("utf-8"))
+            return _cairosvg.svg2png(bytestring=svg_bytes)
         except Exception:
             pass
 
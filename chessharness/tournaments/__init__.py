@@ -5,14 +5,19 @@ create_tournament() is the single entry point for instantiating any format.
 
 To add a new format:
   1. Create chessharness/tournaments/<name>.py implementing Tournament
-  2. Add a case here
+  2. Add an entry to _FACTORIES here
 """
 
 from __future__ import annotations
 
+from typing import Callable
+
 from chessharness.tournaments.base import (
+    FANOUT_QUEUE_SIZE,
     DrawHandling,
+    IncrementalStandings,
     MatchResult,
+    MatchSummary,
     PlayerFactory,
     StandingEntry,
     Tournament,
@@ -36,8 +41,11 @@ from chessharness.tournaments.arena import ArenaTournament
 
 __all__ = [
     # Base types
+    "FANOUT_QUEUE_SIZE",
     "DrawHandling",
+    "IncrementalStandings",
     "MatchResult",
+    "MatchSummary",
     "PlayerFactory",
     "StandingEntry",
     "Tournament",
@@ -62,6 +70,15 @@ __all__ = [
 ]
 
 
+# Maps each tournament type to a constructor taking the draw_handling setting.
+_FACTORIES: dict[TournamentType, Callable[[DrawHandling], Tournament]] = {
+    "knockout": lambda draw_handling: KnockoutTournament(draw_handling=draw_handling),
+    "round_robin": lambda _: RoundRobinTournament(),
+    "swiss": lambda _: SwissTournament(),
+    "arena": lambda _: ArenaTournament(),
+}
+
+
 def create_tournament(
     tournament_type: TournamentType,
     draw_handling: DrawHandling = "rematch",
@@ -73,17 +90,10 @@ def create_tournament(
         tournament_type: "knockout" | "round_robin" | "swiss" | "arena"
         draw_handling:   "rematch" | "coin_flip" | "seed"  (knockout only for now)
     """
-    match tournament_type:
-        case "knockout":
-            return KnockoutTournament(draw_handling=draw_handling)
-        case "round_robin":
-            return RoundRobinTournament()
-        case "swiss":
-            return SwissTournament()
-        case "arena":
-            return ArenaTournament()
-        case _:
-            raise ValueError(
-                f"Unknown tournament type: {tournament_type!r}. "
-                "Valid types: knockout, round_robin, swiss, arena"
-            )
+    factory = _FACTORIES.get(tournament_type)
+    if factory is None:
+        raise ValueError(
+            f"Unknown tournament type: {tournament_type!r}. "
+            f"Valid types: {', '.join(_FACTORIES)}"
+        )
+    return factory(draw_handling)
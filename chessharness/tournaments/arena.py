@@ -6,24 +6,22 @@ from typing import AsyncIterator
 
 from chessharness.config import Config, GameConfig
 from chessharness.tournaments.base import (
+    IncrementalStandings,
     PlayerFactory,
-    StandingEntry,
     Tournament,
     TournamentParticipant,
 )
 from chessharness.tournaments.events import TournamentEvent
 
 
-class ArenaTournament(Tournament):
+class ArenaTournament(IncrementalStandings, Tournament):
     """Time-limited, immediate re-pairing after each game. Not yet implemented."""
 
-    def run(
+    async def run(
         self,
         participants: list[TournamentParticipant],
         config: Config,
         player_factory: PlayerFactory,
     ) -> AsyncIterator[TournamentEvent]:
         raise NotImplementedError("Arena tournament is not yet implemented.")
-
-    def standings(self) -> list[StandingEntry]:
-        raise NotImplementedError
+        yield  # unreachable; makes run() an async generator like the other formats
@@ -9,7 +9,9 @@ identically regardless of format.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, AsyncIterator, Callable, Literal
 
@@ -23,14 +25,22 @@ if TYPE_CHECKING:
 
 DrawHandling = Literal["rematch", "coin_flip", "seed"]
 
+# Default bound for per-consumer queues passed to Tournament.run_fanout().
+FANOUT_QUEUE_SIZE = 64
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TournamentParticipant:
     """A single entrant in a tournament — one (provider, model, seed) tuple."""
 
     provider_name: str
     model: ModelEntry
     seed: int  # 1-based; seed 1 = top seed (first picked)
+    # Hash of (provider_name, model.id, seed), computed once in __post_init__.
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.provider_name, self.model.id, self.seed)))
 
     @property
     def display_name(self) -> str:
@@ -39,13 +49,14 @@ class TournamentParticipant:
     # Manual hash/eq so this can be used as a dict key even though ModelEntry
     # is a mutable dataclass (not hashable by default).
     def __hash__(self) -> int:
-        return hash((self.provider_name, self.model.id, self.seed))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, TournamentParticipant):
             return NotImplemented
         return (
-            self.provider_name == other.provider_name
+            self._hash == other._hash
+            and self.provider_name == other.provider_name
             and self.model.id == other.model.id
             and self.seed == other.seed
         )
@@ -54,7 +65,7 @@ class TournamentParticipant:
         return f"TournamentParticipant({self.display_name!r}, seed={self.seed})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class MatchResult:
     """The outcome of a single game that constitutes a tournament match."""
 
@@ -66,13 +77,43 @@ class MatchResult:
     total_moves: int
     winner: TournamentParticipant | None   # None = draw (rematch may follow)
 
+    # match_id identifies a match uniquely within a tournament, so it alone
+    # defines identity; only the deciding game of a match is ever recorded.
     def __hash__(self) -> int:
-        return hash((self.match_id, self.game_result))
+        return hash(self.match_id)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, MatchResult):
             return NotImplemented
-        return self.match_id == other.match_id and self.game_result == other.game_result
+        return self.match_id == other.match_id
+
+    def summary(self) -> MatchSummary:
+        """This result without its PGN, for long-lived per-tournament records."""
+        return MatchSummary(
+            match_id=self.match_id,
+            white=self.white,
+            black=self.black,
+            game_result=self.game_result,
+            total_moves=self.total_moves,
+            winner=self.winner,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MatchSummary:
+    """
+    A MatchResult minus the PGN.
+
+    Tournaments keep one of these per decided match until the end; the full
+    PGN travels once, on the MatchCompleteEvent, for consumers to persist.
+    """
+
+    match_id: str
+    white: TournamentParticipant
+    black: TournamentParticipant
+    game_result: GameResult
+    total_moves: int
+    winner: TournamentParticipant | None
 
 
 @dataclass
@@ -93,11 +134,75 @@ class StandingEntry:
         return self.wins + self.losses + self.draws
 
 
+def _standing_sort_key(entry: StandingEntry) -> tuple[float, int]:
+    return (-entry.points, entry.participant.seed)
+
+
+class IncrementalStandings:
+    """
+    Mixin that keeps standings sorted as results arrive.
+
+    Every update re-positions only the entries it touches (binary search plus
+    one list shift), so standings() is a plain copy instead of a full sort.
+    Sort order is points descending, then seed ascending.
+    """
+
+    def __init__(self) -> None:
+        self._standings: dict[TournamentParticipant, StandingEntry] = {}
+        self._ranked: list[StandingEntry] = []
+
+    def _init_standings(self, participants: list[TournamentParticipant]) -> None:
+        self._standings = {p: StandingEntry(participant=p) for p in participants}
+        self._ranked = sorted(self._standings.values(), key=_standing_sort_key)
+
+    def _bump_standing(
+        self,
+        participant: TournamentParticipant,
+        *,
+        wins: int = 0,
+        losses: int = 0,
+        draws: int = 0,
+    ) -> None:
+        entry = self._standings[participant]
+        # Seeds are unique, so the old key locates exactly this entry.
+        idx = bisect_left(self._ranked, _standing_sort_key(entry), key=_standing_sort_key)
+        del self._ranked[idx]
+        entry.wins += wins
+        entry.losses += losses
+        entry.draws += draws
+        insort(self._ranked, entry, key=_standing_sort_key)
+
+    def update_match(self, result: MatchResult) -> None:
+        """Credit one result: a win/loss when decided, otherwise a draw for both sides."""
+        if result.winner is None:
+            self._bump_standing(result.white, draws=1)
+            self._bump_standing(result.black, draws=1)
+            return
+        loser = result.black if result.winner == result.white else result.white
+        self._bump_standing(result.winner, wins=1)
+        if loser != result.winner:  # byes use the winner as a placeholder opponent
+            self._bump_standing(loser, losses=1)
+
+    def standings(self) -> list[StandingEntry]:
+        """Return current standings, sorted by points descending."""
+        return list(self._ranked)
+
+
 # Type alias: a callable that creates a fresh Player for a given participant.
 # The tournament calls this per-game so each game starts with clean history.
 PlayerFactory = Callable[[TournamentParticipant], Player]
 
 
+def _put_sentinel_nowait(q: asyncio.Queue) -> None:
+    """Put the end-of-run None on q now, evicting the oldest event if it is full."""
+    while True:
+        try:
+            q.put_nowait(None)
+            return
+        except asyncio.QueueFull:
+            q.get_nowait()
+
+
 class Tournament(ABC):
     """
     Abstract base class for all tournament formats.
@@ -137,3 +242,30 @@ class Tournament(ABC):
     def standings(self) -> list[StandingEntry]:
         """Return current standings, sorted by points descending."""
         ...  # pragma: no cover
+
+    async def run_fanout(
+        self,
+        participants: list[TournamentParticipant],
+        config: Config,
+        player_factory: PlayerFactory,
+        queues: list[asyncio.Queue[TournamentEvent | None]],
+    ) -> None:
+        """
+        Drive run() once and push every event onto each consumer's queue.
+
+        Each consumer (CLI display, PGN writer, test) reads its own queue at
+        its own pace.  Bounded queues (see FANOUT_QUEUE_SIZE) apply
+        back-pressure: the tournament waits for the slowest consumer rather
+        than buffering without limit.  A None sentinel is put on every queue
+        once the tournament ends.  If the run is cancelled or raises, the
+        sentinel is delivered without waiting: a full queue loses its oldest
+        event to make room, so a stalled consumer can't block shutdown.
+        """
+        try:
+            async for event in self.run(participants, config, player_factory):
+                await asyncio.gather(*(q.put(event) for q in queues))
+        except BaseException:
+            for q in queues:
+                _put_sentinel_nowait(q)
+            raise
+        await asyncio.gather(*(q.put(None) for q in queues))
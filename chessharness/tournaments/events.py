@@ -2,9 +2,10 @@
 Tournament event dataclasses — the shared language between the tournament
 loop and any consumer (CLI, WebSocket broadcaster, tests).
 
-Follows the same frozen-dataclass pattern as chessharness/events.py.
-All events are immutable and safe to pass across async boundaries.
-dataclasses.asdict() serialises them to JSON-compatible dicts.
+Follows the same frozen-dataclass pattern as chessharness/events.py, with
+slots=True so the many events queued for broadcast carry no per-instance
+__dict__.  All events are immutable and safe to pass across async
+boundaries.  dataclasses.asdict() serialises them to JSON-compatible dicts.
 """
 
 from __future__ import annotations
@@ -14,12 +15,12 @@ from datetime import datetime
 from typing import Literal
 
 from chessharness.events import GameEvent
-from chessharness.tournaments.base import MatchResult, StandingEntry, TournamentParticipant
+from chessharness.tournaments.base import MatchResult, MatchSummary, StandingEntry, TournamentParticipant
 
 TournamentType = Literal["knockout", "round_robin", "swiss", "arena"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TournamentStartEvent:
     """Fired once before round 1."""
 
@@ -29,7 +30,7 @@ class TournamentStartEvent:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoundStartEvent:
     """Fired at the start of each round, with the full pairing list."""
 
@@ -40,7 +41,7 @@ class RoundStartEvent:
     pairings: list[tuple[str, str, str]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchStartEvent:
     """Fired immediately before a game begins (including rematch games)."""
 
@@ -51,7 +52,7 @@ class MatchStartEvent:
     game_num: int = 1   # 1 for the first game, 2+ for rematches
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchGameEvent:
     """
     Wraps a GameEvent so tournament consumers can identify which match it
@@ -63,7 +64,7 @@ class MatchGameEvent:
     game_event: GameEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchCompleteEvent:
     """Fired after a match is fully decided (after rematches if needed)."""
 
@@ -73,7 +74,7 @@ class MatchCompleteEvent:
     round_num: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoundCompleteEvent:
     """Fired after all matches in a round are decided."""
 
@@ -82,13 +83,13 @@ class RoundCompleteEvent:
     standings: list[StandingEntry]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TournamentCompleteEvent:
     """Fired once the tournament is over."""
 
     winner_name: str
     final_standings: list[StandingEntry]
-    all_results: list[MatchResult]
+    all_results: list[MatchSummary]      # PGNs were delivered on MatchCompleteEvent
     timestamp: datetime = field(default_factory=datetime.now)
 
 
@@ -6,7 +6,8 @@ Rules:
 - Lose once → eliminated.
 - If N participants is not a power of 2, top seeds receive byes in round 1.
 - Draw handling (configurable):
-    "rematch"   — play again with colours swapped, repeat until there's a winner.
+    "rematch"   — play again with colours swapped, repeat until there's a winner
+                  (up to max_rematches, then the seed rule decides).
     "coin_flip" — random advancement, no rematch.
     "seed"      — higher seed (lower number) advances, no rematch.
 """
@@ -15,8 +16,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import math
 import random
+from collections import deque
 from dataclasses import replace
 from typing import AsyncIterator
 
@@ -25,9 +26,10 @@ from chessharness.events import GameOverEvent
 from chessharness.game import run_game
 from chessharness.tournaments.base import (
     DrawHandling,
+    IncrementalStandings,
     MatchResult,
+    MatchSummary,
     PlayerFactory,
-    StandingEntry,
     Tournament,
     TournamentParticipant,
 )
@@ -45,13 +47,54 @@ from chessharness.tournaments.events import (
 logger = logging.getLogger(__name__)
 
 
-class KnockoutTournament(Tournament):
+class _FanIn:
+    """
+    Unbounded many-producer / single-consumer channel for one round's events.
+
+    Match tasks put() without suspending; the round driver awaits drain(),
+    which returns everything queued since its last call.  Tracked tasks
+    close the channel by finishing — no sentinel events are needed.
+    """
+
+    def __init__(self) -> None:
+        self._items: deque[TournamentEvent] = deque()
+        self._ready = asyncio.Event()
+        self._pending = 0
+
+    @property
+    def open(self) -> bool:
+        """True while a tracked task is running or events are still queued."""
+        return self._pending > 0 or bool(self._items)
+
+    def put(self, item: TournamentEvent) -> None:
+        self._items.append(item)
+        self._ready.set()
+
+    def track(self, task: asyncio.Task) -> None:
+        self._pending += 1
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, _task: asyncio.Task) -> None:
+        self._pending -= 1
+        self._ready.set()
+
+    async def drain(self) -> list[TournamentEvent]:
+        while not self._items and self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+        items = list(self._items)
+        self._items.clear()
+        return items
+
+
+class KnockoutTournament(IncrementalStandings, Tournament):
     """Single-elimination knockout tournament."""
 
-    def __init__(self, draw_handling: DrawHandling = "rematch") -> None:
+    def __init__(self, draw_handling: DrawHandling = "rematch", max_rematches: int = 10) -> None:
+        super().__init__()
         self.draw_handling = draw_handling
-        self._standings: dict[TournamentParticipant, StandingEntry] = {}
-        self._all_results: list[MatchResult] = []
+        self.max_rematches = max_rematches
+        self._all_results: list[MatchSummary] = []
 
     # ------------------------------------------------------------------ #
     # Public interface                                                     #
@@ -67,8 +110,7 @@ class KnockoutTournament(Tournament):
             raise ValueError("Knockout tournament requires at least 2 participants.")
 
         # Initialise standings for all participants
-        for p in participants:
-            self._standings[p] = StandingEntry(participant=p)
+        self._init_standings(participants)
 
         bracket = _build_bracket(participants)
         total_rounds = len(bracket)
@@ -80,11 +122,16 @@ class KnockoutTournament(Tournament):
         )
 
         survivors = list(participants)
+        # Bracket slot k (1-based) holds the k-th best seed; index 0 is unused
+        by_seed: list[TournamentParticipant | None] = [
+            None,
+            *sorted(participants, key=lambda p: p.seed),
+        ]
 
         for round_num, round_pairings in enumerate(bracket, 1):
             # Build the pairing list for this round, using current survivors
             # for non-bye slots.  bracket[round_num-1] gives us (seed_a, seed_b | None).
-            match_pairings = _resolve_round_pairings(round_pairings, survivors, round_num)
+            match_pairings = _resolve_round_pairings(round_pairings, survivors, round_num, by_seed)
 
             pairings_display = [
                 (mid, w.display_name, b.display_name if b else "BYE")
@@ -99,12 +146,30 @@ class KnockoutTournament(Tournament):
             round_results: list[MatchResult] = []
             next_survivors: list[TournamentParticipant] = []
 
-            # Run all matches in this round concurrently
-            event_queue: asyncio.Queue[TournamentEvent | None] = asyncio.Queue()
-            active_count = len(match_pairings)
-
-            tasks = [
-                asyncio.create_task(
+            # Run all real matches in this round concurrently.  Byes are
+            # resolved inline; outcomes stays in bracket order either way.
+            fan_in = _FanIn()
+            outcomes: list[
+                asyncio.Task[tuple[MatchResult, TournamentParticipant]]
+                | tuple[MatchResult, TournamentParticipant]
+            ] = []
+            bye_events: list[MatchCompleteEvent] = []
+
+            for mid, w, b in match_pairings:
+                if b is None:
+                    bye_result = _bye_result(mid, w)
+                    self.update_match(bye_result)
+                    bye_events.append(
+                        MatchCompleteEvent(
+                            match_id=mid,
+                            result=bye_result,
+                            advancing_name=w.display_name,
+                            round_num=round_num,
+                        )
+                    )
+                    outcomes.append((bye_result, w))
+                    continue
+                task = asyncio.create_task(
                     self._run_match(
                         match_id=mid,
                         participant_a=w,
@@ -112,25 +177,27 @@ class KnockoutTournament(Tournament):
                         round_num=round_num,
                         config=config,
                         player_factory=player_factory,
-                        out_queue=event_queue,
+                        out_queue=fan_in,
                     )
                 )
-                for mid, w, b in match_pairings
-            ]
+                fan_in.track(task)
+                outcomes.append(task)
 
-            # Drain the shared queue, yielding events as they arrive
-            while active_count > 0:
-                event = await event_queue.get()
-                if event is None:
-                    active_count -= 1
-                else:
+            for event in bye_events:
+                yield event
+
+            # Drain the shared channel, yielding events as they arrive
+            while fan_in.open:
+                for event in await fan_in.drain():
                     yield event
 
-            # Collect results from tasks (each task returns (MatchResult, winner))
-            for task in tasks:
-                result, winner = await task
+            # Collect results (each outcome is (MatchResult, winner)).  The
+            # channel only closes once every tracked task is done, so result()
+            # never blocks.
+            for outcome in outcomes:
+                result, winner = outcome.result() if isinstance(outcome, asyncio.Task) else outcome
                 round_results.append(result)
-                self._all_results.append(result)
+                self._all_results.append(result.summary())
                 next_survivors.append(winner)
 
             survivors = next_survivors
@@ -149,12 +216,6 @@ class KnockoutTournament(Tournament):
             all_results=self._all_results,
         )
 
-    def standings(self) -> list[StandingEntry]:
-        return sorted(
-            self._standings.values(),
-            key=lambda e: (-e.points, e.participant.seed),
-        )
-
     # ------------------------------------------------------------------ #
     # Internal helpers                                                     #
     # ------------------------------------------------------------------ #
@@ -163,155 +224,121 @@ class KnockoutTournament(Tournament):
         self,
         match_id: str,
         participant_a: TournamentParticipant,
-        participant_b: TournamentParticipant | None,  # None = bye
+        participant_b: TournamentParticipant,
         round_num: int,
         config: Config,
         player_factory: PlayerFactory,
-        out_queue: asyncio.Queue,
+        out_queue: _FanIn,
     ) -> tuple[MatchResult, TournamentParticipant]:
         """
         Run a single match (with possible rematches on draw).
-        Puts TournamentEvents into out_queue; sends None sentinel when done.
+        Puts TournamentEvents into out_queue.
         Returns (MatchResult of final deciding game, winning TournamentParticipant).
         """
-        try:
-            # Handle bye
-            if participant_b is None:
-                bye_result = MatchResult(
+        # Assign colours randomly for first game
+        white, black = _random_colors(participant_a, participant_b)
+        game_num = 1
+
+        # Disable PGN auto-save in tournament sub-games; tournament_main handles it
+        sub_game_cfg = replace(config.game, save_pgn=False)
+        sub_config = replace(config, game=sub_game_cfg)
+
+        while True:
+            out_queue.put(
+                MatchStartEvent(
                     match_id=match_id,
-                    white=participant_a,
-                    black=participant_a,  # placeholder
-                    game_result="1-0",
-                    pgn="",
-                    total_moves=0,
-                    winner=participant_a,
+                    white_name=white.display_name,
+                    black_name=black.display_name,
+                    round_num=round_num,
+                    game_num=game_num,
                 )
-                self._standings[participant_a].wins += 1
-                await out_queue.put(
-                    MatchCompleteEvent(
-                        match_id=match_id,
-                        result=bye_result,
-                        advancing_name=participant_a.display_name,
-                        round_num=round_num,
-                    )
-                )
-                return bye_result, participant_a
+            )
 
-            # Assign colours randomly for first game
-            white, black = _random_colors(participant_a, participant_b)
-            game_num = 1
+            white_player = player_factory(white)
+            black_player = player_factory(black)
+
+            game_over: GameOverEvent | None = None
+            async for game_event in run_game(sub_config, white_player, black_player):
+                out_queue.put(MatchGameEvent(match_id=match_id, game_event=game_event))
+                if isinstance(game_event, GameOverEvent):
+                    game_over = game_event
+
+            if game_over is None:
+                logger.warning("Match %s game %d ended without GameOverEvent", match_id, game_num)
+                # Treat as a draw and fall through to draw handling
+                game_result = "1/2-1/2"
+                winner_participant = None
+            else:
+                game_result = game_over.result
+                winner_participant = _determine_winner(game_over, white, black)
+
+            result = MatchResult(
+                match_id=match_id,
+                white=white,
+                black=black,
+                game_result=game_result,
+                pgn=game_over.pgn if game_over else "",
+                total_moves=game_over.total_moves if game_over else 0,
+                winner=winner_participant,
+            )
+
+            if winner_participant is not None:
+                # Clear winner — update standings and finish
+                self.update_match(result)
 
-            while True:
-                await out_queue.put(
-                    MatchStartEvent(
+                out_queue.put(
+                    MatchCompleteEvent(
                         match_id=match_id,
-                        white_name=white.display_name,
-                        black_name=black.display_name,
+                        result=result,
+                        advancing_name=winner_participant.display_name,
                         round_num=round_num,
-                        game_num=game_num,
                     )
                 )
-
-                # Disable PGN auto-save in tournament sub-games; tournament_main handles it
-                sub_game_cfg = replace(config.game, save_pgn=False)
-                sub_config = replace(config, game=sub_game_cfg)
-
-                white_player = player_factory(white)
-                black_player = player_factory(black)
-
-                game_over: GameOverEvent | None = None
-                async for game_event in run_game(sub_config, white_player, black_player):
-                    await out_queue.put(MatchGameEvent(match_id=match_id, game_event=game_event))
-                    if isinstance(game_event, GameOverEvent):
-                        game_over = game_event
-
-                if game_over is None:
-                    logger.warning("Match %s game %d ended without GameOverEvent", match_id, game_num)
-                    # Treat as a draw and fall through to draw handling
-                    game_result = "1/2-1/2"
-                    winner_participant = None
-                else:
-                    game_result = game_over.result
-                    winner_participant = _determine_winner(game_over, white, black)
-
-                result = MatchResult(
-                    match_id=match_id,
-                    white=white,
-                    black=black,
-                    game_result=game_result,
-                    pgn=game_over.pgn if game_over else "",
-                    total_moves=game_over.total_moves if game_over else 0,
-                    winner=winner_participant,
+                return result, winner_participant
+
+            # Draw — apply draw_handling
+            self.update_match(result)
+
+            if self.draw_handling == "rematch" and game_num <= self.max_rematches:
+                # Swap colours and play again
+                white, black = black, white
+                game_num += 1
+                logger.info("Match %s draw — rematch (game %d), colours swapped", match_id, game_num)
+                continue
+
+            elif self.draw_handling == "coin_flip":
+                winner_participant = random.choice([participant_a, participant_b])
+                logger.info(
+                    "Match %s draw — coin flip → %s advances",
+                    match_id,
+                    winner_participant.display_name,
                 )
-
-                if winner_participant is not None:
-                    # Clear winner — update standings and finish
-                    self._standings[winner_participant].wins += 1
-                    loser = black if winner_participant is white else white
-                    self._standings[loser].losses += 1
-
-                    await out_queue.put(
-                        MatchCompleteEvent(
-                            match_id=match_id,
-                            result=result,
-                            advancing_name=winner_participant.display_name,
-                            round_num=round_num,
-                        )
-                    )
-                    return result, winner_participant
-
-                # Draw — apply draw_handling
-                self._standings[white].draws += 1
-                self._standings[black].draws += 1
-
+            else:  # "seed", or "rematch" once max_rematches is used up
                 if self.draw_handling == "rematch":
-                    # Swap colours and play again
-                    white, black = black, white
-                    game_num += 1
-                    logger.info("Match %s draw — rematch (game %d), colours swapped", match_id, game_num)
-                    continue
-
-                elif self.draw_handling == "coin_flip":
-                    winner_participant = random.choice([participant_a, participant_b])
-                    logger.info(
-                        "Match %s draw — coin flip → %s advances",
+                    logger.warning(
+                        "Match %s still drawn after %d rematches — falling back to seed rule",
                         match_id,
-                        winner_participant.display_name,
+                        self.max_rematches,
                     )
-                else:  # "seed"
-                    winner_participant = min(participant_a, participant_b, key=lambda p: p.seed)
-                    logger.info(
-                        "Match %s draw — seed rule → %s (seed %d) advances",
-                        match_id,
-                        winner_participant.display_name,
-                        winner_participant.seed,
-                    )
-
-                loser = participant_b if winner_participant is participant_a else participant_a
-                self._standings[winner_participant].wins += 1
-                self._standings[loser].losses += 1
+                winner_participant = min(participant_a, participant_b, key=lambda p: p.seed)
+                logger.info(
+                    "Match %s draw — seed rule → %s (seed %d) advances",
+                    match_id,
+                    winner_participant.display_name,
+                    winner_participant.seed,
+                )
 
-                final_result = MatchResult(
+            final_result = replace(result, winner=winner_participant)
+            self.update_match(final_result)
+            out_queue.put(
+                MatchCompleteEvent(
                     match_id=match_id,
-                    white=white,
-                    black=black,
-                    game_result=game_result,
-                    pgn=result.pgn,
-                    total_moves=result.total_moves,
-                    winner=winner_participant,
+                    result=final_result,
+                    advancing_name=winner_participant.display_name,
+                    round_num=round_num,
                 )
-                await out_queue.put(
-                    MatchCompleteEvent(
-                        match_id=match_id,
-                        result=final_result,
-                        advancing_name=winner_participant.display_name,
-                        round_num=round_num,
-                    )
-                )
-                return final_result, winner_participant
-
-        finally:
-            await out_queue.put(None)  # sentinel: signals this match is done
+            )
+            return final_result, winner_participant
 
 
 # ------------------------------------------------------------------ #
@@ -319,91 +346,87 @@ class KnockoutTournament(Tournament):
 # ------------------------------------------------------------------ #
 
 def _next_power_of_two(n: int) -> int:
-    return 1 << math.ceil(math.log2(max(n, 2)))
+    return 1 << (max(n, 2) - 1).bit_length()
 
 
 def _build_bracket(
     participants: list[TournamentParticipant],
-) -> list[list[tuple[int, int | None]]]:
+) -> list[list[tuple[int | None, int | None]]]:
     """
     Build a single-elimination bracket.
 
-    Returns a list of rounds.  Each round is a list of (seed_a, seed_b) pairs
-    where seed_b=None means a bye for seed_a.
+    Returns a list of rounds.  Round 1 is a list of (seed_a, seed_b) pairs
+    where seed_b=None means a bye for seed_a.  Later rounds are (None, None)
+    placeholders — their pairings come from the survivors at runtime.
 
     Seeding follows standard single-elimination conventions:
       - Round 1: seed 1 vs seed N, seed 2 vs seed N-1, …
+      - Seeds 1 and 2 can only meet in the final.
       - Byes are awarded to top seeds when count is not a power of 2.
     """
     n = len(participants)
     slots = _next_power_of_two(n)
 
-    # Place seeds into standard bracket positions
-    # Standard bracket: positions [0, slots-1] matched as seed 1 vs seed slots, etc.
-    # Byes fill the bottom (highest-numbered) slots
-    seeded = [p.seed for p in sorted(participants, key=lambda p: p.seed)]
-    bye_count = slots - n
-    # Top seeds get byes: seeds 1..bye_count get byes
-    # They occupy the first bye_count positions in the bracket
-    # We represent this as: seeds 1..bye_count paired with None in round 1
-    # remaining seeds paired normally
-
-    rounds = []
-    current_slots: list[int | None] = list(range(1, n + 1)) + [None] * bye_count
-    # Interleave so seed 1 faces the lowest remaining opponent, etc.
-    current_slots = _interleave_seedings(current_slots)
-
-    while len(current_slots) > 1:
-        round_pairings = [
-            (current_slots[i], current_slots[i + 1])
-            for i in range(0, len(current_slots), 2)
-        ]
-        rounds.append(round_pairings)
-        # Winners placeholder — actual advancement done at runtime
-        current_slots = [None] * (len(current_slots) // 2)
-
+    # Seeds beyond n are empty slots, i.e. byes for their opponents
+    order = _seed_order(slots)
+    rounds: list[list[tuple[int | None, int | None]]] = [[
+        (order[i], order[i + 1] if order[i + 1] <= n else None)
+        for i in range(0, slots, 2)
+    ]]
+    matches = slots >> 1
+    while matches > 1:
+        matches >>= 1
+        rounds.append([(None, None)] * matches)
     return rounds
 
 
-def _interleave_seedings(slots: list[int | None]) -> list[int | None]:
+def _seed_order(slots: int) -> list[int]:
     """
-    Arrange seeds so that seed 1 and seed 2 can only meet in the final,
-    following standard bracket seeding (1 vs N, 2 vs N-1 style folding).
+    Bracket positions for seeds 1..slots (slots must be a power of 2).
+
+    Each doubling pairs every seed s with (2*len+1 - s), folding the
+    previous order so the top seeds stay in opposite halves.
     """
-    n = len(slots)
-    if n <= 1:
-        return slots
-    result: list[int | None] = [None] * n
-    ordered = sorted(slots, key=lambda x: (x is None, x or 0))
-    # Place seed 1 at position 0, seed 2 at position n//2, etc.
-    half = n // 2
-    top = ordered[:half]
-    bottom = ordered[half:][::-1]  # reverse so they face each other last
-    for i, (t, b) in enumerate(zip(top, bottom)):
-        result[i * 2] = t
-        result[i * 2 + 1] = b
-    return result
+    order = [1]
+    while len(order) < slots:
+        mirror = 2 * len(order) + 1
+        order = [seed for s in order for seed in (s, mirror - s)]
+    return order
+
+
+def _bye_result(match_id: str, participant: TournamentParticipant) -> MatchResult:
+    """Walkover result for a participant drawn against an empty slot."""
+    return MatchResult(
+        match_id=match_id,
+        white=participant,
+        black=participant,  # placeholder
+        game_result="1-0",
+        pgn="",
+        total_moves=0,
+        winner=participant,
+    )
 
 
 def _resolve_round_pairings(
-    bracket_round: list[tuple[int, int | None]],
+    bracket_round: list[tuple[int | None, int | None]],
     survivors: list[TournamentParticipant],
     round_num: int,
+    by_seed: list[TournamentParticipant | None],
 ) -> list[tuple[str, TournamentParticipant, TournamentParticipant | None]]:
     """
     Map bracket seed slots to actual TournamentParticipant objects.
 
-    For round 1 the seeds are known; for later rounds we use the survivors
+    For round 1 the seeds are known and looked up in by_seed (participants
+    sorted by seed, offset by one); for later rounds we use the survivors
     list in the order they arrived (winners from left to right in the bracket).
     """
-    seed_map = {p.seed: p for p in survivors}
     pairings: list[tuple[str, TournamentParticipant, TournamentParticipant | None]] = []
 
     if round_num == 1:
         for i, (seed_a, seed_b) in enumerate(bracket_round, 1):
             match_id = f"R{round_num}-M{i}"
-            pa = seed_map[seed_a]
-            pb = seed_map[seed_b] if seed_b is not None else None
+            pa = by_seed[seed_a]
+            pb = by_seed[seed_b] if seed_b is not None else None
             pairings.append((match_id, pa, pb))
     else:
         # survivors are in bracket order (left to right); pair them up
@@ -431,7 +454,7 @@ def _random_colors(
     a: TournamentParticipant, b: TournamentParticipant
 ) -> tuple[TournamentParticipant, TournamentParticipant]:
     """Return (white, black) with random colour assignment."""
-    if random.random() < 0.5:
+    if random.getrandbits(1):
         return a, b
     return b, a
 
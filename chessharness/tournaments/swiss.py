@@ -6,24 +6,22 @@ from typing import AsyncIterator
 
 from chessharness.config import Config, GameConfig
 from chessharness.tournaments.base import (
+    IncrementalStandings,
     PlayerFactory,
-    StandingEntry,
     Tournament,
     TournamentParticipant,
 )
 from chessharness.tournaments.events import TournamentEvent
 
 
-class SwissTournament(Tournament):
+class SwissTournament(IncrementalStandings, Tournament):
     """Score-based pairing, fixed rounds. Not yet implemented."""
 
-    def run(
+    async def run(
         self,
         participants: list[TournamentParticipant],
         config: Config,
         player_factory: PlayerFactory,
     ) -> AsyncIterator[TournamentEvent]:
         raise NotImplementedError("Swiss tournament is not yet implemented.")
-
-    def standings(self) -> list[StandingEntry]:
-        raise NotImplementedError
+        yield  # unreachable; makes run() an async generator like the other formats
@@ -13,31 +13,34 @@ In production FastAPI serves the built frontend from frontend/dist.
 from __future__ import annotations
 
 import asyncio
-import dataclasses
-import json
+import hashlib
+import itertools
 import logging
 import logging.handlers
+import operator
 import os
-import urllib.error
+import time
 import urllib.parse
-import urllib.request
 from collections import deque
 from copy import deepcopy
 from dataclasses import replace
-from datetime import date, datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Callable, Iterable
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
+import httpx
+import orjson
+from anthropic import AsyncAnthropic
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
+from openai import AsyncOpenAI
 
 from chessharness.auth_store import load_auth_tokens, save_auth_tokens
-from chessharness.config import ModelEntry, ProviderConfig, load_config
-from chessharness.conv_logger import ConversationLogger
+from chessharness.config import GameConfig, ModelEntry, ProviderConfig, load_config
 from chessharness.game import run_game
 from chessharness.players import QueuedHumanPlayer, create_player
-from chessharness.players.llm import LLMPlayer
-from chessharness.providers import create_provider
+from chessharness.providers import LLMProvider, create_provider
 
 config = load_config()
 auth_tokens = load_auth_tokens()
@@ -110,7 +113,8 @@ _CODEX_AUTH_PATH = Path.home() / ".codex" / "auth.json"
 
 @app.on_event("startup")
 async def _startup() -> None:
-    """On server start, migrate any stale auth data from older installs."""
+    """On server start, migrate stale auth data and start the Copilot token refresher."""
+    global _copilot_refresh_task
     changed = False
 
     # Migrate old provider key names to copilot_chat.
@@ -139,7 +143,18 @@ async def _startup() -> None:
             changed = True
 
     if changed:
-        save_auth_tokens(auth_tokens)
+        _save_auth_tokens()
+
+    _copilot_refresh_task = asyncio.create_task(_copilot_refresh_loop())
+
+
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    await _stop_copilot_refresh()
+    await _flush_auth_tokens()
+    await _close_sdk_clients()
+    await _close_http_client()
+
 
 # All providers the app knows about, independent of config.yaml
 _KNOWN_PROVIDERS: dict[str, dict] = {
@@ -151,17 +166,84 @@ _KNOWN_PROVIDERS: dict[str, dict] = {
 }
 
 
+# Legacy provider ids and the canonical names they now map to.
+_CANONICAL_PROVIDER_NAMES: dict[str, str] = {
+    "copilot": _COPILOT_CHAT_PROVIDER,
+    "chatgpt": _OPENAI_CHATGPT_PROVIDER,
+    "codex": _OPENAI_CHATGPT_PROVIDER,
+}
+
+
 def _canonical_provider_name(name: str) -> str:
     """Map legacy provider ids to the current canonical name."""
-    if name == "copilot":
-        return _COPILOT_CHAT_PROVIDER
-    if name in {"chatgpt", "codex"}:
-        return _OPENAI_CHATGPT_PROVIDER
-    return name
+    return _CANONICAL_PROVIDER_NAMES.get(name, name)
+
+
+# Every provider shown on the auth page: all known providers plus any extras
+# defined in config.yaml. Neither source changes while the server runs.
+_ALL_PROVIDER_NAMES: tuple[str, ...] = tuple(
+    sorted({_canonical_provider_name(name) for name in (*_KNOWN_PROVIDERS, *config.providers)})
+)
+
+
+# Bumped whenever auth_tokens changes; provider maps built from it are keyed
+# on this so they are rebuilt only after a connect, disconnect or refresh.
+_auth_version = 0
+
+# Memoized provider maps: (inputs, result). Results are shared between
+# callers, which copy before changing anything.
+_config_providers_cache: tuple[object, dict[str, ProviderConfig]] | None = None
+_auth_providers_cache: tuple[tuple[object, object, int], dict[str, ProviderConfig]] | None = None
+
+
+# Writes of auth_tokens to disk are batched: changes within this many seconds
+# of each other share one write, done on a worker thread.
+_AUTH_SAVE_DELAY = 0.2
+_auth_dirty = False
+_auth_save_task: asyncio.Task | None = None
+
+
+def _save_auth_tokens() -> None:
+    """Mark auth_tokens changed: provider maps go stale and a disk write is queued.
+
+    Outside a running event loop (scripts, tests) the file is written at once.
+    """
+    global _auth_version, _auth_dirty, _auth_save_task
+    _auth_version += 1
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        save_auth_tokens(auth_tokens)
+        return
+    _auth_dirty = True
+    if _auth_save_task is None or _auth_save_task.done():
+        _auth_save_task = asyncio.create_task(_auth_token_writer())
+
+
+async def _auth_token_writer() -> None:
+    """Write auth_tokens off the event loop until no changes are pending."""
+    global _auth_dirty
+    while _auth_dirty:
+        await asyncio.sleep(_AUTH_SAVE_DELAY)
+        _auth_dirty = False
+        try:
+            await asyncio.to_thread(save_auth_tokens, dict(auth_tokens))
+        except Exception as exc:
+            logger.error("Saving auth tokens failed: %s", exc)
+
+
+async def _flush_auth_tokens() -> None:
+    """Wait for any queued auth token write to land on disk."""
+    if _auth_save_task is not None:
+        await _auth_save_task
 
 
 def _providers_from_config_with_migrations() -> dict[str, ProviderConfig]:
     """Return config providers with legacy copilot renamed to copilot_chat."""
+    global _config_providers_cache
+    cached = _config_providers_cache
+    if cached is not None and cached[0] is config:
+        return cached[1]
     providers = dict(config.providers)
     if "copilot" in providers and _COPILOT_CHAT_PROVIDER not in providers:
         legacy = providers.pop("copilot")
@@ -178,6 +260,7 @@ def _providers_from_config_with_migrations() -> dict[str, ProviderConfig]:
             p,
             base_url=(p.base_url or _OPENAI_CHATGPT_API_BASE),
         )
+    _config_providers_cache = (config, providers)
     return providers
 
 
@@ -191,7 +274,13 @@ def _copilot_chat_openai_headers() -> dict[str, str]:
 
 def _providers_with_auth_overrides() -> dict[str, ProviderConfig]:
     """Build the runtime provider map: models from config.yaml, tokens from auth_store."""
-    providers = _providers_from_config_with_migrations()
+    global _auth_providers_cache
+    cached = _auth_providers_cache
+    if cached is not None:
+        (cfg, tokens, version), providers = cached
+        if cfg is config and tokens is auth_tokens and version == _auth_version:
+            return providers
+    providers = dict(_providers_from_config_with_migrations())
     for provider_name, info in _KNOWN_PROVIDERS.items():
         token = auth_tokens.get(provider_name)
         if not token:
@@ -199,12 +288,13 @@ def _providers_with_auth_overrides() -> dict[str, ProviderConfig]:
         base_url = auth_tokens.get(f"{provider_name}__base_url") or info.get("base_url")
         if provider_name in providers:
             # Provider defined in config.yaml: inject the stored token (and base_url if set).
-            p = replace(providers[provider_name], bearer_token=token)
+            overrides = {"bearer_token": token}
             if base_url:
-                p = replace(p, base_url=base_url)
-            providers[provider_name] = p
+                overrides["base_url"] = base_url
+            providers[provider_name] = replace(providers[provider_name], **overrides)
         # Providers authenticated via UI but absent from config.yaml have no model list,
         # so they won't appear in the dropdown â€” the user must add them to config.yaml.
+    _auth_providers_cache = ((config, auth_tokens, _auth_version), providers)
     return providers
 
 
@@ -216,10 +306,7 @@ def _find_model_entry(
     prov = providers_cfg.get(provider_name)
     if prov is None:
         return None
-    for model in prov.models:
-        if model.id == model_id:
-            return model
-    return None
+    return prov.find_model(model_id)
 
 
 def _provider_connected(provider_name: str) -> bool:
@@ -233,21 +320,24 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Epoch values above this are milliseconds (seconds would be past year 2286).
+_EPOCH_MS_THRESHOLD = 10_000_000_000
+
+
 def _parse_timestamp_utc(value: object) -> datetime | None:
     if value is None:
         return None
     if isinstance(value, (int, float)):
         # Handle both seconds and milliseconds epoch values.
         seconds = float(value)
-        if seconds > 10_000_000_000:
+        if seconds > _EPOCH_MS_THRESHOLD:
             seconds /= 1000.0
         return datetime.fromtimestamp(seconds, tz=timezone.utc)
     if isinstance(value, str):
         text = value.strip()
         if not text:
             return None
-        if text.endswith("Z"):
-            text = text[:-1] + "+00:00"
+        # fromisoformat() accepts a trailing "Z" natively on Python 3.11+.
         try:
             dt = datetime.fromisoformat(text)
         except ValueError:
@@ -261,8 +351,7 @@ def _load_codex_auth_payload() -> dict | None:
     if not _CODEX_AUTH_PATH.exists():
         return None
     try:
-        raw = _CODEX_AUTH_PATH.read_text(encoding="utf-8")
-        data = json.loads(raw)
+        data = orjson.loads(_CODEX_AUTH_PATH.read_bytes())
     except Exception:
         return None
     return data if isinstance(data, dict) else None
@@ -295,36 +384,81 @@ async def _copilot_chat_exchange_token(github_token: str) -> dict:
     return result
 
 
+_COPILOT_REFRESH_MARGIN = timedelta(minutes=2)
+# Serialises token exchanges so concurrent callers on expiry share one refresh.
+_copilot_refresh_lock = asyncio.Lock()
+_copilot_refresh_task: asyncio.Task | None = None
+
+
+def _copilot_chat_token_fresh() -> bool:
+    provider = _COPILOT_CHAT_PROVIDER
+    expires_at = _parse_timestamp_utc(auth_tokens.get(f"{provider}__expires_at"))
+    return (
+        bool(auth_tokens.get(provider))
+        and expires_at is not None
+        and expires_at > (_utc_now() + _COPILOT_REFRESH_MARGIN)
+    )
+
+
 async def _ensure_copilot_chat_access_token(*, force_refresh: bool = False) -> None:
     """Refresh cached Copilot Chat token from the stored GitHub token when needed."""
     provider = _COPILOT_CHAT_PROVIDER
-    github_token = auth_tokens.get(f"{provider}__github_token")
-    if not github_token:
+    if not auth_tokens.get(f"{provider}__github_token"):
         return
-
-    expires_at = _parse_timestamp_utc(auth_tokens.get(f"{provider}__expires_at"))
-    cached_token = auth_tokens.get(provider)
-    if (
-        not force_refresh
-        and cached_token
-        and expires_at is not None
-        and expires_at > (_utc_now() + timedelta(minutes=2))
-    ):
+    if not force_refresh and _copilot_chat_token_fresh():
         return
 
-    exchange = await _copilot_chat_exchange_token(github_token)
-    access_token = str(exchange["token"]).strip()
-    if not access_token:
-        raise RuntimeError("Copilot exchange returned an empty token")
+    token_before = auth_tokens.get(provider)
+    async with _copilot_refresh_lock:
+        # Another caller may have refreshed while this one waited for the lock.
+        if auth_tokens.get(provider) != token_before:
+            return
+        if not force_refresh and _copilot_chat_token_fresh():
+            return
+        github_token = auth_tokens.get(f"{provider}__github_token")
+        if not github_token:
+            return
 
-    parsed_expiry = (
-        _parse_timestamp_utc(exchange.get("expires_at"))
-        or (_utc_now() + timedelta(seconds=int(exchange.get("expires_in", 1800))))
-    )
-    auth_tokens[provider] = access_token
-    auth_tokens[f"{provider}__github_token"] = github_token
-    auth_tokens[f"{provider}__expires_at"] = parsed_expiry.isoformat()
-    save_auth_tokens(auth_tokens)
+        exchange = await _copilot_chat_exchange_token(github_token)
+        access_token = str(exchange["token"]).strip()
+        if not access_token:
+            raise RuntimeError("Copilot exchange returned an empty token")
+
+        parsed_expiry = (
+            _parse_timestamp_utc(exchange.get("expires_at"))
+            or (_utc_now() + timedelta(seconds=int(exchange.get("expires_in", 1800))))
+        )
+        auth_tokens[provider] = access_token
+        auth_tokens[f"{provider}__github_token"] = github_token
+        auth_tokens[f"{provider}__expires_at"] = parsed_expiry.isoformat()
+        _save_auth_tokens()
+
+
+async def _copilot_refresh_loop() -> None:
+    """Keep the Copilot Chat token fresh so requests rarely wait on an exchange."""
+    provider = _COPILOT_CHAT_PROVIDER
+    while True:
+        delay = 60.0
+        expires_at = _parse_timestamp_utc(auth_tokens.get(f"{provider}__expires_at"))
+        if auth_tokens.get(f"{provider}__github_token") and expires_at is not None:
+            due = expires_at - _COPILOT_REFRESH_MARGIN - _utc_now()
+            delay = max(due.total_seconds(), 0.0) + 1.0
+        await asyncio.sleep(min(delay, 600.0))
+        try:
+            await _ensure_copilot_chat_access_token()
+        except Exception as exc:
+            logger.warning("Background Copilot Chat token refresh failed: %s", exc)
+
+
+async def _stop_copilot_refresh() -> None:
+    global _copilot_refresh_task
+    if _copilot_refresh_task is not None:
+        _copilot_refresh_task.cancel()
+        try:
+            await _copilot_refresh_task
+        except asyncio.CancelledError:
+            pass
+        _copilot_refresh_task = None
 
 
 async def _providers_with_auth_overrides_async() -> dict[str, ProviderConfig]:
@@ -359,13 +493,28 @@ def _make_openai_chatgpt_token_refresher():
             if isinstance(payload, dict):
                 token = _extract_codex_openai_token(payload)
                 if token:
-                    auth_tokens[_OPENAI_CHATGPT_PROVIDER] = token
-                    save_auth_tokens(auth_tokens)
+                    # Saving bumps the auth version, so skip it when Codex
+                    # still holds the token we already have.
+                    if token != auth_tokens.get(_OPENAI_CHATGPT_PROVIDER):
+                        auth_tokens[_OPENAI_CHATGPT_PROVIDER] = token
+                        _save_auth_tokens()
                     return token
         return auth_tokens.get(_OPENAI_CHATGPT_PROVIDER, "")
     return _refresher
 
 
+# The refreshers read module state on each call, so one of each serves every
+# game and tournament.
+_TOKEN_REFRESHERS = {
+    _COPILOT_CHAT_PROVIDER: _make_copilot_token_refresher(),
+    _OPENAI_CHATGPT_PROVIDER: _make_openai_chatgpt_token_refresher(),
+}
+
+
+def _token_refresher_for(provider_name: str):
+    return _TOKEN_REFRESHERS.get(provider_name)
+
+
 async def _verify_token(provider_name: str, providers_cfg: dict[str, ProviderConfig]) -> bool:
     """Verify a provider token is valid via a lightweight API call."""
     ok, _, _ = await _verify_token_detailed(provider_name, providers_cfg)
@@ -403,24 +552,172 @@ def _google_error_kind(data: dict) -> str:
     return "upstream"
 
 
+_VERIFY_TTL_SECONDS = 60.0
+_VERIFY_CACHE_MAX = 64
+# Most provider probes in flight at once; the auth page checks every provider
+# together.
+_VERIFY_CONCURRENCY = 8
+_SDK_CLIENT_CACHE_MAX = 16
+
+_VerifyResult = tuple[bool, str | None, str | None]
+_VerifyKey = tuple[str, str, str | None]
+
+# Definitive verification results (success or auth failure) by
+# (provider, token digest, base_url); upstream errors are never cached.
+_verify_cache: dict[_VerifyKey, tuple[float, _VerifyResult]] = {}
+# Probes currently running, so concurrent identical checks share one call.
+_verify_inflight: dict[_VerifyKey, asyncio.Task[_VerifyResult]] = {}
+_verify_slots = asyncio.Semaphore(_VERIFY_CONCURRENCY)
+# SDK clients reused across probes (each owns an httpx connection pool),
+# least recently used first. Keys are (kind, token, ...).
+_sdk_clients: dict[tuple, object] = {}
+# Background close() calls for clients dropped from _sdk_clients.
+_sdk_client_closers: set[asyncio.Task] = set()
+
+
+# Key formats we can check locally, by provider: a required prefix and the
+# shortest real key.  Every other provider (OpenAI and the OpenAI-compatible
+# ones: kimi, groq, openrouter, local gateways) accepts JWTs, GitHub tokens,
+# vendor-specific formats or short keys like "ollama", so those always go to
+# the network probe.
+_MIN_TOKEN_LENGTH = 20
+_TOKEN_PREFIXES: dict[str, str] = {
+    "anthropic": "sk-ant-",
+    "google": "AIza",
+}
+
+
+def _malformed_token_reason(provider_name: str, token: str) -> str | None:
+    """Why a token can't possibly be valid, or None if it's worth a network probe."""
+    prefix = _TOKEN_PREFIXES.get(provider_name)
+    if prefix is None:
+        return None
+    if len(token) < _MIN_TOKEN_LENGTH:
+        return "Token is too short"
+    if not (token.isascii() and token.isprintable()) or " " in token:
+        return "Token contains whitespace or invalid characters"
+    if not token.startswith(prefix):
+        return f"Token should start with {prefix!r}"
+    return None
+
+
+def _invalidate_verify_cache(provider_name: str, keep: _VerifyKey | None = None) -> None:
+    for key in [k for k in _verify_cache if k[0] == provider_name and k != keep]:
+        del _verify_cache[key]
+
+
+def _verify_key(provider_name: str, prov: ProviderConfig) -> _VerifyKey:
+    digest = hashlib.sha256(prov.auth_token.encode()).hexdigest()
+    return (provider_name, digest, prov.base_url)
+
+
+def _cached_verify_result(key: _VerifyKey) -> _VerifyResult | None:
+    cached = _verify_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _VERIFY_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
+def _sdk_client(key: tuple, factory: Callable[[], object]):
+    client = _sdk_clients.pop(key, None)
+    if client is None:
+        if len(_sdk_clients) >= _SDK_CLIENT_CACHE_MAX:
+            _retire_sdk_client(_sdk_clients.pop(next(iter(_sdk_clients))))
+        client = factory()
+    _sdk_clients[key] = client  # (re)insert as most recently used
+    return client
+
+
+def _retire_sdk_client(client) -> None:
+    """Close a client dropped from the cache without waiting on it."""
+    task = asyncio.create_task(_close_sdk_client(client))
+    _sdk_client_closers.add(task)
+    task.add_done_callback(_sdk_client_closers.discard)
+
+
+async def _close_sdk_client(client) -> None:
+    try:
+        await client.close()
+    except Exception as exc:
+        logger.debug("Closing SDK client failed: %s", exc)
+
+
+def _drop_sdk_clients(token: str) -> None:
+    """Forget clients built for a token that failed authentication."""
+    for key in [k for k in _sdk_clients if k[1] == token]:
+        _retire_sdk_client(_sdk_clients.pop(key))
+
+
+async def _close_sdk_clients() -> None:
+    clients = list(_sdk_clients.values())
+    _sdk_clients.clear()
+    await asyncio.gather(*(_close_sdk_client(c) for c in clients), *_sdk_client_closers)
+
+
+def _openai_client(token: str, base_url: str | None, default_headers: dict[str, str] | None = None):
+    key = ("openai", token, base_url, tuple(sorted((default_headers or {}).items())))
+    return _sdk_client(
+        key,
+        lambda: AsyncOpenAI(api_key=token, base_url=base_url, default_headers=default_headers),
+    )
+
+
 async def _verify_token_detailed(
     provider_name: str,
     providers_cfg: dict[str, ProviderConfig],
-) -> tuple[bool, str | None, str | None]:
-    """Return (ok, failure_kind, detail) where failure_kind is 'auth' or 'upstream'."""
+) -> _VerifyResult:
+    """Return (ok, failure_kind, detail) where failure_kind is 'auth' or 'upstream'.
+
+    Results are cached for _VERIFY_TTL_SECONDS and identical concurrent checks
+    share a single probe.
+    """
     prov = providers_cfg.get(provider_name)
     if not prov or not prov.auth_token:
         return False, "auth", "Missing token"
+    malformed = _malformed_token_reason(provider_name, prov.auth_token)
+    if malformed:
+        return False, "auth", malformed
+
+    key = _verify_key(provider_name, prov)
+    cached = _cached_verify_result(key)
+    if cached is not None:
+        return cached
+
+    task = _verify_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_bounded_probe(provider_name, prov))
+        _verify_inflight[key] = task
+        task.add_done_callback(lambda _t: _verify_inflight.pop(key, None))
+    result = await asyncio.shield(task)
+
+    if not result[0] and result[1] == "auth":
+        _drop_sdk_clients(prov.auth_token)
+    if result[0] or result[1] == "auth":
+        _verify_cache.pop(key, None)
+        if len(_verify_cache) >= _VERIFY_CACHE_MAX:
+            del _verify_cache[next(iter(_verify_cache))]  # oldest first
+        _verify_cache[key] = (time.monotonic(), result)
+    return result
+
+
+async def _bounded_probe(provider_name: str, prov: ProviderConfig) -> _VerifyResult:
+    async with _verify_slots:
+        return await _probe_token(provider_name, prov)
+
+
+async def _probe_token(provider_name: str, prov: ProviderConfig) -> _VerifyResult:
+    """Make the lightweight API call behind _verify_token_detailed."""
     token = prov.auth_token
     try:
         async with asyncio.timeout(8):
             if provider_name == "anthropic":
-                import anthropic as _anthropic
-                client = _anthropic.AsyncAnthropic(api_key=token)
+                client = _sdk_client(
+                    ("anthropic", token),
+                    lambda: AsyncAnthropic(api_key=token),
+                )
                 await client.models.list()
             elif provider_name == _OPENAI_CHATGPT_PROVIDER:
-                from openai import AsyncOpenAI
-                client = AsyncOpenAI(api_key=token, base_url=prov.base_url)
+                client = _openai_client(token, prov.base_url)
                 probe_model = (
                     prov.models[0].id
                     if prov.models
@@ -433,9 +730,11 @@ async def _verify_token_detailed(
                     store=False,
                 )
             elif provider_name == "google":
+                # One model is enough to prove the key works; the full
+                # catalogue is hundreds of entries we'd parse and throw away.
                 url = (
                     "https://generativelanguage.googleapis.com/v1beta/models?"
-                    + urllib.parse.urlencode({"key": token})
+                    + urllib.parse.urlencode({"key": token, "pageSize": 1})
                 )
                 data = await _http_get(url)
                 if isinstance(data, dict) and "error" in data:
@@ -449,17 +748,11 @@ async def _verify_token_detailed(
                     if "token" in exchange:
                         return True, None, None
                 except Exception:
-                    from openai import AsyncOpenAI
-                    client = AsyncOpenAI(
-                        api_key=token,
-                        base_url=prov.base_url,
-                        default_headers=_copilot_chat_openai_headers(),
-                    )
+                    client = _openai_client(token, prov.base_url, _copilot_chat_openai_headers())
                     await client.models.list()
             else:
                 # openai, kimi, groq, openrouter, â€¦
-                from openai import AsyncOpenAI
-                client = AsyncOpenAI(api_key=token, base_url=prov.base_url)
+                client = _openai_client(token, prov.base_url)
                 await client.models.list()
         return True, None, None
     except Exception as exc:
@@ -467,13 +760,89 @@ async def _verify_token_detailed(
         return False, kind, str(exc)
 
 
-def _to_json(data: dict) -> str:
-    """json.dumps with datetime â†’ ISO-string support."""
-    def _default(obj: object) -> str:
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
-    return json.dumps(data, default=_default)
+def _dumps_event(payload: dict) -> bytes:
+    """Serialise a payload for a binary WebSocket frame (orjson, UTF-8 JSON).
+
+    This is the only WebSocket encoder.  Frames go out with send_bytes, so the
+    bytes orjson produces are sent as-is, with no str decode here and no
+    re-encode per subscriber in the server; the frontend decodes them with
+    parseFrame().  orjson handles datetimes, dates and
+    dataclasses natively; default=str covers anything else.  Naive datetimes
+    stay naive rather than being stamped as UTC: event timestamps are local time.
+    """
+    return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _frame_has_type(frame: bytes, event_type: str) -> bool:
+    """Whether an encoded payload has this "type" (always its first key)."""
+    return frame.startswith(b'{"type":"%s"' % event_type.encode())
+
+
+def _join_frames(frames: Iterable[bytes]) -> bytes:
+    """Pack encoded events into one JSON array frame (parseFrameEvents in the frontend)."""
+    return b"[" + b",".join(frames) + b"]"
+
+
+async def _pump_frames(ws: WebSocket, q: asyncio.Queue) -> None:
+    """
+    Forward queued frames to a socket until it closes.
+
+    Frames that piled up while the previous send was in flight go out together
+    as one JSON array frame, so bursts (reasoning chunks, replays to slow
+    clients) cost one send instead of one per event.  Nothing is held back
+    waiting for more: a lone frame is sent as soon as it arrives.
+    """
+    while True:
+        frame = await q.get()
+        if not q.empty():
+            frames = [frame]
+            while not q.empty():
+                frames.append(q.get_nowait())
+            frame = _join_frames(frames)
+        await ws.send_bytes(frame)
+
+
+async def _receive_command(ws: WebSocket) -> dict:
+    """
+    Read the next client message as JSON.
+
+    Like ws.receive_json(), but parsed with orjson and accepting text or
+    binary frames alike; the frontend sends text.
+    """
+    message = await ws.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    data = message.get("bytes")
+    return orjson.loads(data if data is not None else message.get("text") or "")
+
+
+def _fan_out(
+    subs: Iterable[asyncio.Queue],
+    encoded: bytes,
+    snapshot: Callable[[], dict | None],
+) -> None:
+    """
+    Put an encoded event on every subscriber queue without blocking.
+
+    A full queue means that client is _MAX_SUBSCRIBER_QUEUE events behind.
+    Its backlog is collapsed into one snapshot of current state (built at most
+    once per event), which the frontend reducers apply wholesale, so a slow
+    client catches up instead of silently missing events.
+    """
+    resync: bytes | None = None
+    for q in subs:
+        try:
+            q.put_nowait(encoded)
+            continue
+        except asyncio.QueueFull:
+            pass
+        while not q.empty():
+            q.get_nowait()
+        if resync is None:
+            state = snapshot()
+            resync = _dumps_event(state) if state is not None else encoded
+        q.put_nowait(resync)
+
 
 _DIST = Path(__file__).parent.parent.parent / "frontend" / "dist"
 
@@ -482,37 +851,104 @@ _DIST = Path(__file__).parent.parent.parent / "frontend" / "dist"
 # REST                                                                         #
 # --------------------------------------------------------------------------- #
 
+# Encoded on first request and served as raw bytes; reset whenever stored
+# auth changes.
+_models_body: bytes | None = None
+
+
+def _invalidate_models_cache() -> None:
+    global _models_body
+    _models_body = None
+
+
 @app.get("/api/models")
 def get_models():
-    providers_cfg = _providers_with_auth_overrides()
-    return [
-        {
-            "provider": provider,
-            "id": m.id,
-            "name": m.name,
-            "supports_vision": m.supports_vision,
-        }
-        for provider, prov in providers_cfg.items()
-        for m in prov.models
-    ]
+    global _models_body
+    if _models_body is None:
+        providers_cfg = _providers_with_auth_overrides()
+        _models_body = orjson.dumps([
+            {
+                "provider": provider,
+                "id": m.id,
+                "name": m.name,
+                "supports_vision": m.supports_vision,
+            }
+            for provider, prov in providers_cfg.items()
+            for m in prov.models
+        ])
+    return Response(content=_models_body, media_type="application/json")
+
+
+# config is loaded once at import, so the /api/config body never changes;
+# it is encoded on first request and served as raw bytes afterwards.
+_config_body: bytes | None = None
 
 
 @app.get("/api/config")
 def get_config():
-    return {
-        "max_retries": config.game.max_retries,
-        "show_legal_moves": config.game.show_legal_moves,
-        "board_input": config.game.board_input,
-        "annotate_pgn": config.game.annotate_pgn,
-        "max_output_tokens": config.game.max_output_tokens,
-        "reasoning_effort": config.game.reasoning_effort,
-    }
+    global _config_body
+    if _config_body is None:
+        _config_body = orjson.dumps({
+            "max_retries": config.game.max_retries,
+            "show_legal_moves": config.game.show_legal_moves,
+            "board_input": config.game.board_input,
+            "annotate_pgn": config.game.annotate_pgn,
+            "max_output_tokens": config.game.max_output_tokens,
+            "reasoning_effort": config.game.reasoning_effort,
+        })
+    return Response(content=_config_body, media_type="application/json")
 
 
 # --------------------------------------------------------------------------- #
 # GitHub helpers                                                               #
 # --------------------------------------------------------------------------- #
 
+_DEFAULT_HTTP_HEADERS = {"Accept": "application/json", "User-Agent": "ChessHarness/1.0"}
+# Idle connections stay open for a minute.  httpx's default of 5s is the same as
+# GitHub's device-flow poll interval, so polls would keep opening a fresh TLS
+# connection to the same host.
+_HTTP_KEEPALIVE_EXPIRY = 60
+_http_client: httpx.AsyncClient | None = None
+
+
+def _http() -> httpx.AsyncClient:
+    """Shared keep-alive client for outbound API calls (created on first use)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            headers=_DEFAULT_HTTP_HEADERS,
+            timeout=15,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _http_client
+
+
+async def _close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _json_or_raise(resp: httpx.Response, label: str) -> dict | list:
+    """Decode a JSON body; error responses without one become RuntimeError.
+
+    orjson parses the buffered body bytes directly, skipping the text decode
+    httpx's resp.json() performs first; model lists can run to hundreds of
+    entries.
+    """
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
+        if resp.status_code < 400:
+            raise
+        raise RuntimeError(f"{label} {resp.status_code}: {resp.content[:200]}") from None
+
+
 async def _github_http(
     method: str,
     url: str,
@@ -520,31 +956,12 @@ async def _github_http(
     data: dict | None = None,
     token: str | None = None,
 ) -> dict:
-    """Async GitHub API call using asyncio.to_thread + stdlib urllib (no extra deps)."""
-
-    def _do() -> dict:
-        headers: dict[str, str] = {
-            "Accept": "application/json",
-            "User-Agent": "ChessHarness/1.0",
-        }
-        if token:
-            headers["Authorization"] = f"token {token}"
-        encoded: bytes | None = None
-        if data is not None:
-            encoded = urllib.parse.urlencode(data).encode()
-            headers["Content-Type"] = "application/x-www-form-urlencoded"
-        req = urllib.request.Request(url, data=encoded, headers=headers, method=method)
-        try:
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                return json.loads(resp.read())
-        except urllib.error.HTTPError as exc:
-            body = exc.read()
-            try:
-                return json.loads(body)
-            except Exception:
-                raise RuntimeError(f"GitHub HTTP {exc.code}: {body[:200]}") from exc
-
-    return await asyncio.to_thread(_do)
+    """Async GitHub API call over the shared httpx client."""
+    headers: dict[str, str] = {}
+    if token:
+        headers["Authorization"] = f"token {token}"
+    resp = await _http().request(method, url, data=data, headers=headers)
+    return _json_or_raise(resp, "GitHub HTTP")
 
 
 async def _http_get(
@@ -555,65 +972,60 @@ async def _http_get(
     api_key: str | None = None,
     extra_headers: dict[str, str] | None = None,
 ) -> dict | list:
-    """Generic async HTTP GET via stdlib urllib (no extra deps)."""
-
-    def _do() -> dict | list:
-        headers: dict[str, str] = {
-            "Accept": "application/json",
-            "User-Agent": "ChessHarness/1.0",
-        }
-        if bearer_token:
-            headers["Authorization"] = f"Bearer {bearer_token}"
-        if api_key_header and api_key:
-            headers[api_key_header] = api_key
-        if extra_headers:
-            headers.update(extra_headers)
-        req = urllib.request.Request(url, headers=headers, method="GET")
-        try:
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                return json.loads(resp.read())
-        except urllib.error.HTTPError as exc:
-            body = exc.read()
-            try:
-                return json.loads(body)
-            except Exception:
-                raise RuntimeError(f"HTTP {exc.code}: {body[:200]}") from exc
-
-    return await asyncio.to_thread(_do)
+    """Generic async HTTP GET over the shared httpx client."""
+    headers: dict[str, str] = {}
+    if bearer_token:
+        headers["Authorization"] = f"Bearer {bearer_token}"
+    if api_key_header and api_key:
+        headers[api_key_header] = api_key
+    if extra_headers:
+        headers.update(extra_headers)
+    resp = await _http().get(url, headers=headers)
+    return _json_or_raise(resp, "HTTP")
 
 
 # --------------------------------------------------------------------------- #
 # Auth                                                                         #
 # --------------------------------------------------------------------------- #
 
+async def _auth_provider_status(name: str, providers_cfg: dict[str, ProviderConfig]) -> dict:
+    # Codex-imported ChatGPT tokens can fail strict verification despite being
+    # usable for Codex responses. Treat stored Codex auth as connected.
+    if (
+        name == _OPENAI_CHATGPT_PROVIDER
+        and auth_tokens.get(_OPENAI_CHATGPT_PROVIDER)
+        and auth_tokens.get(f"{_OPENAI_CHATGPT_PROVIDER}__source") == "codex_auth"
+    ):
+        return {"provider": name, "connected": True}
+
+    ok, kind, detail = await _verify_token_detailed(name, providers_cfg)
+    if not ok and kind == "upstream":
+        logger.warning(
+            "Provider connectivity check failed due to upstream error [provider=%s]: %s",
+            name,
+            detail,
+        )
+    return {"provider": name, "connected": ok}
+
+
 @app.get("/api/auth/providers")
-async def get_auth_providers():
-    providers_cfg = await _providers_with_auth_overrides_async()
-    # Always show all known providers plus any extras defined in config.yaml
-    provider_names = sorted(
-        {_canonical_provider_name(name) for name in (set(_KNOWN_PROVIDERS) | set(config.providers))}
-    )
+def get_auth_providers():
+    """Whether each provider has a token; no network calls (see the verify endpoint)."""
+    return [
+        {"provider": name, "connected": _provider_connected(name)}
+        for name in _ALL_PROVIDER_NAMES
+    ]
 
-    async def check(name: str) -> dict:
-        # Codex-imported ChatGPT tokens can fail strict verification despite being
-        # usable for Codex responses. Treat stored Codex auth as connected.
-        if (
-            name == _OPENAI_CHATGPT_PROVIDER
-            and auth_tokens.get(_OPENAI_CHATGPT_PROVIDER)
-            and auth_tokens.get(f"{_OPENAI_CHATGPT_PROVIDER}__source") == "codex_auth"
-        ):
-            return {"provider": name, "connected": True}
-
-        ok, kind, detail = await _verify_token_detailed(name, providers_cfg)
-        if not ok and kind == "upstream":
-            logger.warning(
-                "Provider connectivity check failed due to upstream error [provider=%s]: %s",
-                name,
-                detail,
-            )
-        return {"provider": name, "connected": ok}
 
-    return await asyncio.gather(*[check(name) for name in provider_names])
+@app.post("/api/auth/providers/{provider}/verify")
+async def verify_auth_provider(provider: str):
+    """Re-check one provider's token now, ignoring any cached verification."""
+    provider = _canonical_provider_name(provider.strip())
+    if provider not in _ALL_PROVIDER_NAMES:
+        raise HTTPException(status_code=404, detail=f"Unknown provider: {provider}")
+    _invalidate_verify_cache(provider)
+    providers_cfg = await _providers_with_auth_overrides_async()
+    return await _auth_provider_status(provider, providers_cfg)
 
 
 @app.post("/api/auth/connect")
@@ -626,6 +1038,7 @@ async def connect_auth(payload: dict):
         raise HTTPException(status_code=404, detail=f"Unknown provider: {provider}")
     if not token:
         raise HTTPException(status_code=400, detail="token is required")
+    force = bool(payload.get("force"))
 
     # Build a temporary ProviderConfig with the candidate token and verify it
     providers_from_cfg = _providers_from_config_with_migrations()
@@ -636,6 +1049,14 @@ async def connect_auth(payload: dict):
             bearer_token=token,
             base_url=_KNOWN_PROVIDERS[provider].get("base_url"),
         )}
+    verify_key = _verify_key(provider, test_cfg[provider])
+    if force:
+        _invalidate_verify_cache(provider)
+    elif auth_tokens.get(provider) == token:
+        cached = _cached_verify_result(verify_key)
+        if cached is not None and cached[0]:
+            # Re-submitting the stored, recently verified token: nothing to do.
+            return {"provider": provider, "connected": True}
     verified, failure_kind, failure_detail = await _verify_token_detailed(provider, test_cfg)
     if not verified:
         if provider == _OPENAI_CHATGPT_PROVIDER:
@@ -647,7 +1068,9 @@ async def connect_auth(payload: dict):
             )
             auth_tokens[f"{provider}__source"] = "manual"
             auth_tokens[provider] = token
-            save_auth_tokens(auth_tokens)
+            _save_auth_tokens()
+            _invalidate_models_cache()
+            _invalidate_verify_cache(provider)
             return {"provider": provider, "connected": True, "verified": False}
         if failure_kind == "auth":
             raise HTTPException(status_code=401, detail=f"Token verification failed for {provider}")
@@ -663,11 +1086,16 @@ async def connect_auth(payload: dict):
 
     if provider == _COPILOT_CHAT_PROVIDER:
         # Prefer GitHub token -> Copilot token exchange; accept direct Copilot token as fallback.
+        # Both calls need only the submitted token, so they run together; the
+        # exchange result is used only if the token also identifies a GitHub user.
         exchanged = False
+        me, exchange = await asyncio.gather(
+            _github_http("GET", "https://api.github.com/user", token=token),
+            _copilot_chat_exchange_token(token),
+            return_exceptions=True,
+        )
         try:
-            me = await _github_http("GET", "https://api.github.com/user", token=token)
-            if "login" in me:
-                exchange = await _copilot_chat_exchange_token(token)
+            if isinstance(me, dict) and "login" in me and isinstance(exchange, dict):
                 access_token = str(exchange["token"]).strip()
                 expires_at = (
                     _parse_timestamp_utc(exchange.get("expires_at"))
@@ -685,12 +1113,14 @@ async def connect_auth(payload: dict):
             auth_tokens.pop(f"{provider}__expires_at", None)
     else:
         auth_tokens[provider] = token
-    save_auth_tokens(auth_tokens)
+    _save_auth_tokens()
+    _invalidate_models_cache()
+    _invalidate_verify_cache(provider, keep=verify_key)
     return {"provider": provider, "connected": True}
 
 
 @app.post("/api/auth/disconnect")
-def disconnect_auth(payload: dict):
+async def disconnect_auth(payload: dict):
     provider = _canonical_provider_name(str(payload.get("provider", "")).strip())
     if not provider:
         raise HTTPException(status_code=400, detail="provider is required")
@@ -700,7 +1130,9 @@ def disconnect_auth(payload: dict):
     for k in keys_to_remove:
         del auth_tokens[k]
     if keys_to_remove:
-        save_auth_tokens(auth_tokens)
+        _save_auth_tokens()
+        _invalidate_models_cache()
+        _invalidate_verify_cache(provider)
     return {"provider": provider, "connected": _provider_connected(provider)}
 
 
@@ -740,7 +1172,8 @@ async def connect_openai_from_codex():
 
     auth_tokens["openai"] = token
     auth_tokens["openai__source"] = "codex_auth"
-    save_auth_tokens(auth_tokens)
+    _save_auth_tokens()
+    _invalidate_models_cache()
     return {
         "provider": "openai",
         "connected": True,
@@ -797,7 +1230,8 @@ async def connect_openai_chatgpt_from_codex():
 
     auth_tokens[_OPENAI_CHATGPT_PROVIDER] = token
     auth_tokens[f"{_OPENAI_CHATGPT_PROVIDER}__source"] = "codex_auth"
-    save_auth_tokens(auth_tokens)
+    _save_auth_tokens()
+    _invalidate_models_cache()
     return {
         "provider": _OPENAI_CHATGPT_PROVIDER,
         "connected": True,
@@ -881,7 +1315,8 @@ async def copilot_device_poll(payload: dict):
     auth_tokens[_COPILOT_CHAT_PROVIDER] = access_token
     auth_tokens[f"{_COPILOT_CHAT_PROVIDER}__github_token"] = github_token
     auth_tokens[f"{_COPILOT_CHAT_PROVIDER}__expires_at"] = expires_at.isoformat()
-    save_auth_tokens(auth_tokens)
+    _save_auth_tokens()
+    _invalidate_models_cache()
 
     return {"status": "connected"}
 
@@ -917,10 +1352,12 @@ class _TournamentBroadcaster:
     """
 
     def __init__(self) -> None:
-        self._all_subs: list[asyncio.Queue] = []
-        self._game_subs: dict[str, list[asyncio.Queue]] = {}
-        self._game_log: dict[str, deque[dict]] = {}   # match_id -> serialised events (bounded)
-        self._tournament_log: deque[dict] = deque(maxlen=_MAX_TOURNAMENT_REPLAY_EVENTS)
+        # Subscriber queues live in sets so disconnects are O(1) removals.
+        self._all_subs: set[asyncio.Queue] = set()
+        self._game_subs: dict[str, set[asyncio.Queue]] = {}
+        # Replay logs hold encoded frames, so reconnects re-send them as-is.
+        self._game_log: dict[str, deque[bytes]] = {}   # match_id -> encoded events (bounded)
+        self._tournament_log: deque[bytes] = deque(maxlen=_MAX_TOURNAMENT_REPLAY_EVENTS)
         self._tournament_state: dict = self._initial_tournament_state()
         self._game_state: dict[str, dict] = {}
         self._pgns: list[str] = []                    # PGN for each completed game
@@ -1228,11 +1665,11 @@ class _TournamentBroadcaster:
             return
 
     def replay_has_tournament_root(self) -> bool:
-        return bool(self._tournament_log) and self._tournament_log[0].get("type") == "TournamentStartEvent"
+        return bool(self._tournament_log) and _frame_has_type(self._tournament_log[0], "TournamentStartEvent")
 
     def replay_has_game_root(self, match_id: str) -> bool:
         log = self._game_log.get(match_id)
-        return bool(log) and log[0].get("type") == "GameStartEvent"
+        return bool(log) and _frame_has_type(log[0], "GameStartEvent")
 
     def tournament_snapshot_payload(self) -> dict:
         return {"type": "TournamentSnapshotEvent", **deepcopy(self._tournament_state)}
@@ -1247,70 +1684,52 @@ class _TournamentBroadcaster:
 
     def subscribe(self) -> asyncio.Queue:
         q: asyncio.Queue = asyncio.Queue(maxsize=_MAX_SUBSCRIBER_QUEUE)
-        self._all_subs.append(q)
+        self._all_subs.add(q)
         return q
 
     def unsubscribe(self, q: asyncio.Queue) -> None:
-        try:
-            self._all_subs.remove(q)
-        except ValueError:
-            pass
+        self._all_subs.discard(q)
 
     def subscribe_game(self, match_id: str) -> asyncio.Queue:
         q: asyncio.Queue = asyncio.Queue(maxsize=_MAX_SUBSCRIBER_QUEUE)
-        self._game_subs.setdefault(match_id, []).append(q)
+        self._game_subs.setdefault(match_id, set()).add(q)
         return q
 
     def unsubscribe_game(self, match_id: str, q: asyncio.Queue) -> None:
-        subs = self._game_subs.get(match_id, [])
-        try:
-            subs.remove(q)
-        except ValueError:
-            pass
+        subs = self._game_subs.get(match_id)
+        if subs is None:
+            return
+        subs.discard(q)
         if not subs:
-            self._game_subs.pop(match_id, None)
+            del self._game_subs[match_id]
 
-    def replay_log(self) -> list[dict]:
+    def replay_log(self) -> list[bytes]:
         return list(self._tournament_log)
 
-    def game_replay_log(self, match_id: str) -> list[dict]:
+    def game_replay_log(self, match_id: str) -> list[bytes]:
         return list(self._game_log.get(match_id, []))
 
     # ── Broadcasting ─────────────────────────────────────────────────── #
 
-    @staticmethod
-    def _enqueue_latest(q: asyncio.Queue, payload: dict) -> None:
-        """Bounded fan-out: if a subscriber is slow, drop its oldest queued item."""
-        try:
-            q.put_nowait(payload)
-            return
-        except asyncio.QueueFull:
-            pass
-
-        try:
-            q.get_nowait()
-        except asyncio.QueueEmpty:
-            pass
-
-        try:
-            q.put_nowait(payload)
-        except asyncio.QueueFull:
-            # If still full, skip this payload for that subscriber.
-            return
+    # Each event is encoded once; the same text goes to the replay log and
+    # every live subscriber queue.
 
     async def _broadcast_all(self, payload: dict) -> None:
         self._apply_payload_to_state(payload)
-        self._tournament_log.append(payload)
-        for q in list(self._all_subs):
-            self._enqueue_latest(q, payload)
+        encoded = _dumps_event(payload)
+        self._tournament_log.append(encoded)
+        if self._all_subs:
+            _fan_out(self._all_subs, encoded, self.tournament_snapshot_payload)
 
     async def _broadcast_game(self, match_id: str, payload: dict) -> None:
+        encoded = _dumps_event(payload)
         self._game_log.setdefault(
             match_id,
             deque(maxlen=_MAX_GAME_REPLAY_EVENTS),
-        ).append(payload)
-        for q in list(self._game_subs.get(match_id, [])):
-            self._enqueue_latest(q, payload)
+        ).append(encoded)
+        subs = self._game_subs.get(match_id)
+        if subs:
+            _fan_out(subs, encoded, lambda: self.game_snapshot_payload(match_id))
 
     # ── Tournament runner ─────────────────────────────────────────────── #
 
@@ -1351,8 +1770,9 @@ class _TournamentBroadcaster:
                 await self._broadcast_all(t_payload)
 
                 if isinstance(event, MatchGameEvent):
-                    g_payload = _to_json_dict(event.game_event)
-                    await self._broadcast_game(event.match_id, g_payload)
+                    # Same dict the tournament payload already nests; reducers
+                    # only read payloads, so sharing it is safe.
+                    await self._broadcast_game(event.match_id, t_payload["game_event"])
 
                 if isinstance(event, MatchCompleteEvent) and event.result.pgn:
                     self._pgns.append(event.result.pgn)
@@ -1373,24 +1793,76 @@ _tournament_broadcaster = _TournamentBroadcaster()
 _last_tournament_payload: dict | None = None
 
 
+# Leaf types returned unchanged by _to_json_dict without further checks.
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+# Per-class public field names for dataclasses, plus a getter that reads their
+# values in one call; None marks a non-dataclass.
+_FieldsGetter = Callable[[object], tuple]
+_FIELDS_CACHE: dict[type, tuple[tuple[str, ...], _FieldsGetter] | None] = {}
+
+
+def _tuple_getter(names: tuple[str, ...]) -> _FieldsGetter:
+    """operator.attrgetter that returns a tuple for any number of names."""
+    if len(names) > 1:
+        return operator.attrgetter(*names)
+    if names:
+        get = operator.attrgetter(names[0])
+        return lambda obj: (get(obj),)
+    return lambda obj: ()
+
+
+def _dataclass_fields(cls: type) -> tuple[tuple[str, ...], _FieldsGetter] | None:
+    try:
+        return _FIELDS_CACHE[cls]
+    except KeyError:
+        pass
+    fields = None
+    if _dc.is_dataclass(cls):
+        names = tuple(f.name for f in _dc.fields(cls) if not f.name.startswith("_"))
+        fields = (names, _tuple_getter(names))
+    _FIELDS_CACHE[cls] = fields
+    return fields
+
+
 def _to_json_dict(obj):
     """Recursively convert a dataclass to a JSON-safe structure.
 
     Unlike dataclasses.asdict(), this injects a "type" key (the class name) at
     *every* level of nesting, not just the top.  That lets the frontend reducer
     dispatch on the type of nested events (e.g. the game_event inside a
-    MatchGameEvent) without extra bookkeeping.
+    MatchGameEvent) without extra bookkeeping.  Underscore-prefixed fields
+    (internal caches such as TournamentParticipant._hash) are skipped.
+    Field names and their getter are built once per class and cached.
     """
-    if _dc.is_dataclass(obj) and not isinstance(obj, type):
-        d: dict = {"type": type(obj).__name__}
-        for f in _dc.fields(obj):
-            d[f.name] = _to_json_dict(getattr(obj, f.name))
+    if isinstance(obj, _JSON_SCALARS):
+        return obj
+    cls = type(obj)
+    fields = _dataclass_fields(cls)
+    if fields is not None:
+        names, getter = fields
+        d: dict = {"type": cls.__name__}
+        for name, value in zip(names, getter(obj)):
+            d[name] = _to_json_dict(value)
         return d
     if isinstance(obj, (list, tuple)):
         return [_to_json_dict(item) for item in obj]
     return obj
 
 
+def _event_payload(event) -> dict:
+    """Shallow {"type": ..., **fields} dict for a flat game event.
+
+    Unlike dataclasses.asdict() this does not deep-copy list and dict fields;
+    events are never mutated after run_game yields them, so sharing is safe.
+    """
+    cls = type(event)
+    names, getter = _dataclass_fields(cls)
+    payload: dict = {"type": cls.__name__}
+    payload.update(zip(names, getter(event)))
+    return payload
+
+
 @app.get("/api/tournament/status")
 def tournament_status():
     return _tournament_broadcaster.status
@@ -1462,51 +1934,24 @@ async def tournament_start(payload: dict):
             )
         )
 
-    game_cfg = config.game
-    ui_settings = payload.get("settings") or {}
-    if ui_settings:
-        overrides: dict = {}
-        if "max_retries" in ui_settings:
-            overrides["max_retries"] = max(1, int(ui_settings["max_retries"]))
-        if "show_legal_moves" in ui_settings:
-            overrides["show_legal_moves"] = bool(ui_settings["show_legal_moves"])
-        if ui_settings.get("board_input") in ("text", "image"):
-            overrides["board_input"] = ui_settings["board_input"]
-        if "annotate_pgn" in ui_settings:
-            overrides["annotate_pgn"] = bool(ui_settings["annotate_pgn"])
-        if "max_output_tokens" in ui_settings:
-            overrides["max_output_tokens"] = max(1, int(ui_settings["max_output_tokens"]))
-        if "reasoning_effort" in ui_settings:
-            effort = ui_settings["reasoning_effort"]
-            if effort in ("low", "medium", "high", None, "", "default", "auto", "none"):
-                overrides["reasoning_effort"] = (
-                    effort if effort in ("low", "medium", "high") else None
-                )
-        if "starting_fen" in ui_settings:
-            fen = (ui_settings["starting_fen"] or "").strip()
-            overrides["starting_fen"] = fen if fen else None
-        if overrides:
-            game_cfg = replace(game_cfg, **overrides)
-    tournament_config = replace(config, game=game_cfg)
-
-    copilot_refresher = _make_copilot_token_refresher()
-    openai_chatgpt_refresher = _make_openai_chatgpt_token_refresher()
-
-    def _token_refresher_for(provider_name: str):
-        if provider_name == _COPILOT_CHAT_PROVIDER:
-            return copilot_refresher
-        if provider_name == _OPENAI_CHATGPT_PROVIDER:
-            return openai_chatgpt_refresher
-        return None
+    game_cfg = _apply_ui_game_settings(payload.get("settings") or {})
+    tournament_config = replace(config, game=game_cfg) if game_cfg is not config.game else config
+
+    # A participant plays one game at a time, so its provider (and the SDK
+    # client's connection pool inside it) is reused across its matches. The
+    # player is still created fresh per game, so no history leaks.
+    providers_by_participant: dict[TournamentParticipant, LLMProvider] = {}
 
     def player_factory(participant: TournamentParticipant):
-        provider = create_provider(
-            participant.provider_name,
-            participant.model.id,
-            providers_cfg,
-            supports_vision_override=participant.model.supports_vision,
-            token_refresher=_token_refresher_for(participant.provider_name),
-        )
+        provider = providers_by_participant.get(participant)
+        if provider is None:
+            provider = providers_by_participant[participant] = create_provider(
+                participant.provider_name,
+                participant.model.id,
+                providers_cfg,
+                supports_vision_override=participant.model.supports_vision,
+                token_refresher=_token_refresher_for(participant.provider_name),
+            )
         return create_player(
             participant.provider_name,
             participant.display_name,
@@ -1540,24 +1985,20 @@ async def tournament_restart():
 async def tournament_ws(ws: WebSocket) -> None:
     """
     Subscribe to all tournament events (bracket updates + per-game board updates).
-    Replays the full event log on connect so late joiners are caught up.
+    Replays the full event log on connect, as one array frame, so late joiners
+    are caught up.
     """
     await ws.accept()
     q = _tournament_broadcaster.subscribe()
     try:
         # If replay was truncated past TournamentStartEvent, bootstrap from snapshot.
         if _tournament_broadcaster.replay_has_tournament_root():
-            for past_event in _tournament_broadcaster.replay_log():
-                await ws.send_text(json.dumps(past_event, default=str))
+            await ws.send_bytes(_join_frames(_tournament_broadcaster.replay_log()))
         else:
-            await ws.send_text(
-                json.dumps(_tournament_broadcaster.tournament_snapshot_payload(), default=str)
-            )
+            await ws.send_bytes(_dumps_event(_tournament_broadcaster.tournament_snapshot_payload()))
 
         # Then stream live events
-        while True:
-            payload = await q.get()
-            await ws.send_text(json.dumps(payload, default=str))
+        await _pump_frames(ws, q)
     except (WebSocketDisconnect, asyncio.CancelledError):
         pass
     finally:
@@ -1574,16 +2015,13 @@ async def tournament_game_ws(ws: WebSocket, match_id: str) -> None:
     q = _tournament_broadcaster.subscribe_game(match_id)
     try:
         if _tournament_broadcaster.replay_has_game_root(match_id):
-            for past_event in _tournament_broadcaster.game_replay_log(match_id):
-                await ws.send_text(json.dumps(past_event, default=str))
+            await ws.send_bytes(_join_frames(_tournament_broadcaster.game_replay_log(match_id)))
         else:
             snapshot = _tournament_broadcaster.game_snapshot_payload(match_id)
             if snapshot is not None:
-                await ws.send_text(json.dumps(snapshot, default=str))
+                await ws.send_bytes(_dumps_event(snapshot))
 
-        while True:
-            payload = await q.get()
-            await ws.send_text(json.dumps(payload, default=str))
+        await _pump_frames(ws, q)
     except (WebSocketDisconnect, asyncio.CancelledError):
         pass
     finally:
@@ -1594,32 +2032,56 @@ async def tournament_game_ws(ws: WebSocket, match_id: str) -> None:
 # WebSocket game                                                                #
 # --------------------------------------------------------------------------- #
 
-def _apply_ui_game_settings(ui_settings: dict) -> object:
-    game_cfg = config.game
-    if ui_settings:
-        overrides: dict = {}
-        if "max_retries" in ui_settings:
-            overrides["max_retries"] = max(1, int(ui_settings["max_retries"]))
-        if "show_legal_moves" in ui_settings:
-            overrides["show_legal_moves"] = bool(ui_settings["show_legal_moves"])
-        if ui_settings.get("board_input") in ("text", "image"):
-            overrides["board_input"] = ui_settings["board_input"]
-        if "annotate_pgn" in ui_settings:
-            overrides["annotate_pgn"] = bool(ui_settings["annotate_pgn"])
-        if "max_output_tokens" in ui_settings:
-            overrides["max_output_tokens"] = max(1, int(ui_settings["max_output_tokens"]))
-        if "reasoning_effort" in ui_settings:
-            effort = ui_settings["reasoning_effort"]
-            if effort in ("low", "medium", "high", None, "", "default", "auto", "none"):
-                overrides["reasoning_effort"] = effort if effort in ("low", "medium", "high") else None
-        if "starting_fen" in ui_settings:
-            fen = (ui_settings["starting_fen"] or "").strip()
-            overrides["starting_fen"] = fen if fen else None
-        if overrides:
-            game_cfg = replace(game_cfg, **overrides)
-    return game_cfg
+def _positive_int(value: object) -> int:
+    return max(1, int(value))
+
+
+def _optional_fen(value: object) -> str | None:
+    return (value or "").strip() or None
+
+
+# UI settings copied into GameConfig overrides, each with its coercer.
+_UI_SETTING_COERCERS: tuple[tuple[str, Callable[[object], object]], ...] = (
+    ("max_retries", _positive_int),
+    ("show_legal_moves", bool),
+    ("annotate_pgn", bool),
+    ("max_output_tokens", _positive_int),
+    ("starting_fen", _optional_fen),
+)
+_BOARD_INPUTS = frozenset({"text", "image"})
+# Accepted reasoning_effort values and what they override to (None means the
+# provider default); any other value is ignored.
+_REASONING_EFFORT_OVERRIDES: dict[str | None, str | None] = {
+    "low": "low",
+    "medium": "medium",
+    "high": "high",
+    None: None,
+    "": None,
+    "default": None,
+    "auto": None,
+    "none": None,
+}
 
 
+def _apply_ui_game_settings(ui_settings: dict) -> GameConfig:
+    """Return config.game with the UI's per-game settings applied."""
+    game_cfg = config.game
+    if not ui_settings:
+        return game_cfg
+    overrides = {
+        key: coerce(ui_settings[key])
+        for key, coerce in _UI_SETTING_COERCERS
+        if key in ui_settings
+    }
+    board_input = ui_settings.get("board_input")
+    if isinstance(board_input, str) and board_input in _BOARD_INPUTS:
+        overrides["board_input"] = board_input
+    if "reasoning_effort" in ui_settings:
+        effort = ui_settings["reasoning_effort"]
+        if (effort is None or isinstance(effort, str)) and effort in _REASONING_EFFORT_OVERRIDES:
+            overrides["reasoning_effort"] = _REASONING_EFFORT_OVERRIDES[effort]
+    return replace(game_cfg, **overrides) if overrides else game_cfg
+
 
 def _player_kind_from_spec(spec: dict) -> str:
     kind = str(spec.get("kind") or "").strip().lower()
@@ -1678,10 +2140,17 @@ class _SingleGameSession:
         return False, "Multiple human players are active; specify a color."
 
 
+# Game ids for conversation log filenames: the server start time plus a
+# per-process sequence number, so games started within the same second (a
+# quick restart) never append to each other's log files.
+_RUN_PREFIX = datetime.now().strftime("%Y%m%d_%H%M%S")
+_GAME_SEQ = itertools.count(1)
+
+
 async def _build_single_game_players(start_payload: dict):
     ui_settings = start_payload.get("settings") or {}
     game_cfg = _apply_ui_game_settings(ui_settings)
-    session_config = replace(config, game=game_cfg)
+    session_config = replace(config, game=game_cfg) if game_cfg is not config.game else config
 
     player_specs = {
         "white": _normalize_player_spec(start_payload["white"], "white"),
@@ -1689,15 +2158,6 @@ async def _build_single_game_players(start_payload: dict):
     }
 
     providers_cfg = await _providers_with_auth_overrides_async()
-    copilot_refresher = _make_copilot_token_refresher()
-    openai_chatgpt_refresher = _make_openai_chatgpt_token_refresher()
-
-    def _token_refresher_for(provider_name: str):
-        if provider_name == _COPILOT_CHAT_PROVIDER:
-            return copilot_refresher
-        if provider_name == _OPENAI_CHATGPT_PROVIDER:
-            return openai_chatgpt_refresher
-        return None
 
     def _build_player(spec: dict):
         if spec["kind"] == "human":
@@ -1728,23 +2188,17 @@ async def _build_single_game_players(start_payload: dict):
     white_player = _build_player(player_specs["white"])
     black_player = _build_player(player_specs["black"])
 
-    game_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    game_id = f"{_RUN_PREFIX}_{next(_GAME_SEQ):06d}"
     log_dir = Path("./logs")
-    for player, color in ((white_player, "white"), (black_player, "black")):
-        if isinstance(player, LLMPlayer):
-            player._logger = ConversationLogger(
-                log_dir=log_dir,
-                game_id=game_id,
-                player_name=player.name,
-                color=color,
-            )
+    white_player.attach_conversation_log(log_dir, game_id, "white")
+    black_player.attach_conversation_log(log_dir, game_id, "black")
 
     return _SingleGameSession(session_config, white_player, black_player, player_specs)
 
 class _SingleGameBroadcaster:
     def __init__(self) -> None:
-        self._subs: list[asyncio.Queue] = []
-        self._log: deque[dict] = deque(maxlen=_MAX_SINGLE_GAME_REPLAY_EVENTS)
+        self._subs: set[asyncio.Queue] = set()
+        self._log: deque[bytes] = deque(maxlen=_MAX_SINGLE_GAME_REPLAY_EVENTS)  # encoded events
         self._state: dict = self._initial_state()
         self._task: asyncio.Task | None = None
         self._stop_event: asyncio.Event | None = None
@@ -1771,20 +2225,17 @@ class _SingleGameBroadcaster:
 
     def subscribe(self) -> asyncio.Queue:
         q: asyncio.Queue = asyncio.Queue(maxsize=_MAX_SUBSCRIBER_QUEUE)
-        self._subs.append(q)
+        self._subs.add(q)
         return q
 
     def unsubscribe(self, q: asyncio.Queue) -> None:
-        try:
-            self._subs.remove(q)
-        except ValueError:
-            pass
+        self._subs.discard(q)
 
-    def replay_log(self) -> list[dict]:
+    def replay_log(self) -> list[bytes]:
         return list(self._log)
 
     def replay_has_root(self) -> bool:
-        return bool(self._log) and self._log[0].get("type") == "GameStartEvent"
+        return bool(self._log) and _frame_has_type(self._log[0], "GameStartEvent")
 
     def snapshot_payload(self) -> dict:
         return {"type": "GameSnapshotEvent", **deepcopy(self._state)}
@@ -1921,27 +2372,12 @@ class _SingleGameBroadcaster:
             self._state["awaitingHumanInput"] = None
             return
 
-    @staticmethod
-    def _enqueue_latest(q: asyncio.Queue, payload: dict) -> None:
-        try:
-            q.put_nowait(payload)
-            return
-        except asyncio.QueueFull:
-            pass
-        try:
-            q.get_nowait()
-        except asyncio.QueueEmpty:
-            pass
-        try:
-            q.put_nowait(payload)
-        except asyncio.QueueFull:
-            return
-
     async def _broadcast(self, payload: dict) -> None:
         self._apply_event(payload)
-        self._log.append(payload)
-        for q in list(self._subs):
-            self._enqueue_latest(q, payload)
+        encoded = _dumps_event(payload)
+        self._log.append(encoded)
+        if self._subs:
+            _fan_out(self._subs, encoded, self.snapshot_payload)
 
     def start(self, start_payload: dict) -> None:
         if self._task and not self._task.done():
@@ -1963,8 +2399,7 @@ class _SingleGameBroadcaster:
             session = await _build_single_game_players(start_payload)
             self._session = session
             async for event in run_game(session.config, session.white_player, session.black_player, stop_event):
-                payload = {"type": type(event).__name__, **dataclasses.asdict(event)}
-                await self._broadcast(payload)
+                await self._broadcast(_event_payload(event))
         except Exception as exc:
             logger.error("Single game error: %s", exc, exc_info=True)
             await self._broadcast({"type": "error", "message": str(exc)})
@@ -1981,37 +2416,31 @@ async def game_ws(ws: WebSocket) -> None:
     q = _single_game_broadcaster.subscribe()
 
     try:
-        first = await ws.receive_json()
+        first = await _receive_command(ws)
         first_type = first.get("type")
 
         if first_type == "start":
             try:
                 _single_game_broadcaster.start(first)
             except RuntimeError as exc:
-                await ws.send_text(_to_json({"type": "error", "message": str(exc)}))
+                await ws.send_bytes(_dumps_event({"type": "error", "message": str(exc)}))
         elif first_type == "stop":
             _single_game_broadcaster.stop()
         elif first_type != "resume":
-            await ws.send_text(_to_json({"type": "error", "message": "Unsupported websocket command."}))
+            await ws.send_bytes(_dumps_event({"type": "error", "message": "Unsupported websocket command."}))
 
         # Reconnect bootstrap: replay if intact, else send snapshot.
         if first_type != "start" or _single_game_broadcaster.replay_log():
             if _single_game_broadcaster.replay_has_root():
-                for past_event in _single_game_broadcaster.replay_log():
-                    await ws.send_text(json.dumps(past_event, default=str))
+                await ws.send_bytes(_join_frames(_single_game_broadcaster.replay_log()))
             else:
                 snap = _single_game_broadcaster.snapshot_payload()
                 if snap.get("phase") != "setup":
-                    await ws.send_text(json.dumps(snap, default=str))
-
-        async def _send_loop() -> None:
-            while True:
-                payload = await q.get()
-                await ws.send_text(json.dumps(payload, default=str))
+                    await ws.send_bytes(_dumps_event(snap))
 
         async def _receive_loop() -> None:
             while True:
-                msg = await ws.receive_json()
+                msg = await _receive_command(ws)
                 msg_type = msg.get("type")
                 if msg_type == "stop":
                     _single_game_broadcaster.stop()
@@ -2019,37 +2448,39 @@ async def game_ws(ws: WebSocket) -> None:
                     try:
                         _single_game_broadcaster.start(msg)
                     except RuntimeError as exc:
-                        await ws.send_text(_to_json({"type": "error", "message": str(exc)}))
+                        await ws.send_bytes(_dumps_event({"type": "error", "message": str(exc)}))
                 elif msg_type == "submit_move":
                     ok, error = _single_game_broadcaster.submit_human_move(
                         str(msg.get("move") or ""),
                         msg.get("color"),
                     )
                     if not ok and error:
-                        await ws.send_text(_to_json({"type": "error", "message": error}))
-
-        send_task = asyncio.create_task(_send_loop())
-        recv_task = asyncio.create_task(_receive_loop())
-
-        done, pending = await asyncio.wait(
-            {send_task, recv_task}, return_when=asyncio.FIRST_COMPLETED
-        )
-        for task in pending:
-            task.cancel()
-            try:
-                await task
-            except (asyncio.CancelledError, WebSocketDisconnect):
-                pass
+                        await ws.send_bytes(_dumps_event({"type": "error", "message": error}))
+
+        # Neither loop returns normally: whichever fails first (usually the
+        # receive side, on disconnect) ends the session.  Both are cancelled
+        # and reaped together in the finally block, which also runs when this
+        # handler is itself cancelled, so neither loop outlives the connection.
+        tasks = {
+            asyncio.create_task(_pump_frames(ws, q)),
+            asyncio.create_task(_receive_loop()),
+        }
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
 
-        for task in done:
-            if task.exception():
-                raise task.exception()  # type: ignore[misc]
+        errors = [task.exception() for task in tasks if not task.cancelled()]
+        if errors:
+            raise errors[0]  # type: ignore[misc]
 
     except WebSocketDisconnect:
         pass
     except Exception as exc:
         try:
-            await ws.send_text(_to_json({"type": "error", "message": str(exc)}))
+            await ws.send_bytes(_dumps_event({"type": "error", "message": str(exc)}))
         except Exception:
             pass
     finally:
@@ -2065,9 +2496,17 @@ if _DIST.exists():
         "/assets", StaticFiles(directory=_DIST / "assets"), name="assets"
     )
 
+    # index.html only changes on a rebuild, which means a server restart, so
+    # it is read and hashed once instead of stat'ed and streamed per request.
+    _INDEX_HTML = (_DIST / "index.html").read_bytes()
+    _INDEX_ETAG = f'"{hashlib.sha256(_INDEX_HTML).hexdigest()[:32]}"'
+    _INDEX_HEADERS = {"ETag": _INDEX_ETAG, "Cache-Control": "no-cache"}
+
     @app.get("/{full_path:path}")
-    async def spa(full_path: str) -> FileResponse:
-        return FileResponse(_DIST / "index.html")
+    async def spa(full_path: str, request: Request) -> Response:
+        if request.headers.get("if-none-match") == _INDEX_ETAG:
+            return Response(status_code=304, headers=_INDEX_HEADERS)
+        return Response(_INDEX_HTML, media_type="text/html", headers=_INDEX_HEADERS)
 
 
 
@@ -4,7 +4,7 @@ import { providerLabel, compareProviderNames } from '../utils/providerLabels.js'
 
 export default function ModelPicker({
   models, authProviders, authReady,
-  onConnect, onDisconnect,
+  onConnect, onDisconnect, onVerify,
   onCopilotDeviceStart, onCopilotDevicePoll,
   onChatGPTCodexConnect,
   onStart, error, defaultSettings,
@@ -132,6 +132,13 @@ export default function ModelPicker({
     setAuthMessage(result ? `Disconnected ${provider}.` : `Failed to disconnect ${provider}.`)
   }
 
+  const verify = async (provider) => {
+    setAuthMessage(`Checking ${provider}...`)
+    const result = await onVerify(provider)
+    if (result === null) setAuthMessage(`Failed to check ${provider}.`)
+    else setAuthMessage(result ? `${provider} token works.` : `${provider} token was rejected.`)
+  }
+
   const connectChatGPTCodex = async () => {
     setAuthMessage('Importing ChatGPT/Codex auth...')
     const result = await onChatGPTCodexConnect()
@@ -298,6 +305,7 @@ export default function ModelPicker({
 
                     {connected && (
                       <div className="auth-actions">
+                        <button className="btn-inline" onClick={() => verify('copilot_chat')}>Verify</button>
                         <button className="btn-inline danger" onClick={() => disconnect('copilot_chat')}>Disconnect</button>
                       </div>
                     )}
@@ -322,6 +330,9 @@ export default function ModelPicker({
                       </div>
                     )}
                     <div className="auth-actions">
+                      {connected && (
+                        <button className="btn-inline" onClick={() => verify('openai_chatgpt')}>Verify</button>
+                      )}
                       <button className="btn-inline danger" onClick={() => disconnect('openai_chatgpt')}>Disconnect</button>
                     </div>
                   </div>
@@ -345,6 +356,9 @@ export default function ModelPicker({
                   />
                   <div className="auth-actions">
                     <button className="btn-inline" onClick={() => connect(provider)}>Connect</button>
+                    {connected && (
+                      <button className="btn-inline" onClick={() => verify(provider)}>Verify</button>
+                    )}
                     <button className="btn-inline danger" onClick={() => disconnect(provider)}>Disconnect</button>
                   </div>
                 </div>
@@ -84,6 +84,18 @@ export function AppProvider({ children }) {
     }
   }, [])
 
+  const verifyProvider = useCallback(async (provider) => {
+    try {
+      const res = await fetch(`/api/auth/providers/${encodeURIComponent(provider)}/verify`, { method: 'POST' })
+      if (!res.ok) return null
+      const data = await res.json()
+      setAuthProviders(prev => ({ ...prev, [provider]: !!data.connected }))
+      return !!data.connected
+    } catch {
+      return null
+    }
+  }, [])
+
   const startCopilotDeviceFlow = useCallback(async () => {
     try {
       const res = await fetch('/api/auth/copilot_chat/device/start', { method: 'POST' })
@@ -138,6 +150,7 @@ export function AppProvider({ children }) {
       refreshModels,
       connectProvider,
       disconnectProvider,
+      verifyProvider,
       startCopilotDeviceFlow,
       pollCopilotDeviceFlow,
       connectOpenAIChatGPTFromCodex,
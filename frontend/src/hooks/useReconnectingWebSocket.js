@@ -15,6 +15,7 @@
  */
 
 import { useEffect, useRef, useState } from 'react'
+import { parseFrameEvents } from '../utils/wsFrames.js'
 
 const MIN_DELAY_MS = 1_000
 const MAX_DELAY_MS = 30_000
@@ -42,6 +43,7 @@ export function useReconnectingWebSocket(url, onMessage) {
       if (!mounted) return
 
       ws = new WebSocket(url)
+      ws.binaryType = 'arraybuffer'
 
       ws.onopen = () => {
         if (!mounted) return
@@ -51,7 +53,7 @@ export function useReconnectingWebSocket(url, onMessage) {
 
       ws.onmessage = (e) => {
         try {
-          onMessageRef.current(JSON.parse(e.data))
+          for (const event of parseFrameEvents(e.data)) onMessageRef.current(event)
         } catch { /* ignore malformed frames */ }
       }
 
@@ -2,6 +2,7 @@
 import ModelPicker from '../components/ModelPicker.jsx'
 import GameView from '../components/GameView.jsx'
 import { useAppContext } from '../context/AppContext.jsx'
+import { parseFrameEvents } from '../utils/wsFrames.js'
 
 const INITIAL_STATE = {
   phase: 'setup',
@@ -171,7 +172,7 @@ function applyEvent(state, event) {
 export default function GamePage() {
   const {
     models, authProviders, authReady, defaultSettings,
-    connectProvider, disconnectProvider,
+    connectProvider, disconnectProvider, verifyProvider,
     startCopilotDeviceFlow, pollCopilotDeviceFlow,
     connectOpenAIChatGPTFromCodex,
   } = useAppContext()
@@ -211,6 +212,7 @@ export default function GamePage() {
 
     const connect = (mode) => {
       const ws = new WebSocket(url)
+      ws.binaryType = 'arraybuffer'
       wsRef.current = ws
 
       ws.onopen = () => {
@@ -221,7 +223,8 @@ export default function GamePage() {
 
       ws.onmessage = (e) => {
         if (sessionRef.current !== thisSession || wsRef.current !== ws) return
-        setState(s => applyEvent(s, JSON.parse(e.data)))
+        const events = parseFrameEvents(e.data)
+        setState(s => events.reduce((acc, event) => applyEvent(acc, event), s))
       }
 
       ws.onerror = () => {
@@ -280,6 +283,7 @@ export default function GamePage() {
         authReady={authReady}
         onConnect={connectProvider}
         onDisconnect={disconnectProvider}
+        onVerify={verifyProvider}
         onCopilotDeviceStart={startCopilotDeviceFlow}
         onCopilotDevicePoll={pollCopilotDeviceFlow}
         onChatGPTCodexConnect={connectOpenAIChatGPTFromCodex}
@@ -0,0 +1,16 @@
+// The backend sends events as binary frames holding UTF-8 JSON (see
+// _dumps_event in chessharness/web/app.py). Sockets that read them should set
+// ws.binaryType = 'arraybuffer'; text frames are still accepted.
+const decoder = new TextDecoder()
+
+export function parseFrame(data) {
+  return JSON.parse(typeof data === 'string' ? data : decoder.decode(data))
+}
+
+// A frame holds one event object, or a JSON array of events when the server
+// sent several at once (a replay on connect, or a backlog flushed by
+// _pump_frames). Always returns an array.
+export function parseFrameEvents(data) {
+  const parsed = parseFrame(data)
+  return Array.isArray(parsed) ? parsed : [parsed]
+}
@@ -15,11 +15,9 @@ from pathlib import Path
 from chessharness.config import load_config
 from chessharness.providers import create_provider
 from chessharness.players import create_player
-from chessharness.players.llm import LLMPlayer
 from chessharness.game import run_game
 from chessharness.cli.display import display_event, console
 from chessharness.cli.selector import select_players
-from chessharness.conv_logger import ConversationLogger
 
 
 async def _main(stop_event: asyncio.Event) -> None:
@@ -73,14 +71,8 @@ async def _main(stop_event: asyncio.Event) -> None:
     # Attach per-player conversation loggers (shared game_id keeps filenames paired)
     log_dir = Path("./logs")
     game_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    for player, color in ((white_player, "white"), (black_player, "black")):
-        if isinstance(player, LLMPlayer):
-            player._logger = ConversationLogger(
-                log_dir=log_dir,
-                game_id=game_id,
-                player_name=player.name,
-                color=color,
-            )
+    white_player.attach_conversation_log(log_dir, game_id, "white")
+    black_player.attach_conversation_log(log_dir, game_id, "black")
     console.print(f"[dim]Logs: {log_dir}/game_{game_id}_white_*.log / ..._black_*.log[/]\n")
 
     # Run game — consume events and display them
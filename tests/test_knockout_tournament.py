@@ -9,11 +9,12 @@ from __future__ import annotations
 import asyncio
 import math
 import unittest
+from dataclasses import replace
 
 from chessharness.config import Config, GameConfig, ModelEntry
 from chessharness.players.base import GameState, MoveResponse, Player
-from chessharness.tournaments import KnockoutTournament, TournamentParticipant
-from chessharness.tournaments.base import DrawHandling
+from chessharness.tournaments import FANOUT_QUEUE_SIZE, KnockoutTournament, TournamentParticipant
+from chessharness.tournaments.base import DrawHandling, MatchResult, MatchSummary
 from chessharness.tournaments.events import (
     MatchCompleteEvent,
     MatchStartEvent,
@@ -95,6 +96,8 @@ class TestBracketGeneration:
         assert _next_power_of_two(5) == 8
         assert _next_power_of_two(8) == 8
         assert _next_power_of_two(9) == 16
+        assert _next_power_of_two(2**29) == 2**29
+        assert _next_power_of_two(2**53 + 1) == 2**54
 
     def test_bracket_two_players(self):
         participants = make_participants(2)
@@ -140,6 +143,13 @@ class TestBracketGeneration:
         byes = [b for _, b in round1 if b is None]
         assert len(byes) == 2
 
+    def test_bracket_top_two_seeds_in_opposite_halves(self):
+        participants = make_participants(8)
+        round1 = _build_bracket(participants)[0]
+        assert round1 == [(1, 8), (4, 5), (2, 7), (3, 6)]
+        top_half = {s for pair in round1[:2] for s in pair}
+        assert 1 in top_half and 2 not in top_half
+
 
 # --------------------------------------------------------------------------- #
 # Tournament run — event sequence                                              #
@@ -185,6 +195,15 @@ class TestKnockoutEventSequence(unittest.IsolatedAsyncioTestCase):
         complete = next(e for e in events if isinstance(e, TournamentCompleteEvent))
         self.assertIn(complete.winner_name, {p.display_name for p in participants})
 
+    async def test_complete_event_carries_summaries_without_pgn(self):
+        participants = make_participants(4)
+        tournament = KnockoutTournament(draw_handling="seed")
+        events = await collect_events(tournament, participants)
+        complete = next(e for e in events if isinstance(e, TournamentCompleteEvent))
+        match_ids = [e.match_id for e in events if isinstance(e, MatchCompleteEvent)]
+        self.assertEqual(sorted(r.match_id for r in complete.all_results), sorted(match_ids))
+        self.assertTrue(all(isinstance(r, MatchSummary) for r in complete.all_results))
+
     async def test_match_complete_advancing_name(self):
         participants = make_participants(2)
         tournament = KnockoutTournament(draw_handling="seed")
@@ -264,6 +283,66 @@ class TestDrawHandling(unittest.IsolatedAsyncioTestCase):
         complete = next(e for e in events if isinstance(e, TournamentCompleteEvent))
         self.assertIn(complete.winner_name, {p.display_name for p in participants})
 
+    async def test_rematches_are_capped_then_seed_decides(self):
+        participants = make_participants(2)
+        tournament = KnockoutTournament(draw_handling="rematch", max_rematches=2)
+        # Bare kings: every game is an immediate draw by insufficient material.
+        config = replace(
+            FAST_GAME_CONFIG,
+            game=replace(FAST_GAME_CONFIG.game, starting_fen="8/8/8/4k3/8/8/8/4K3 w - - 0 1"),
+        )
+        events = await collect_events(tournament, participants, config)
+        starts = [e for e in events if isinstance(e, MatchStartEvent)]
+        self.assertEqual([e.game_num for e in starts], [1, 2, 3])
+        complete = next(e for e in events if isinstance(e, TournamentCompleteEvent))
+        self.assertEqual(complete.winner_name, participants[0].display_name)
+
+
+# --------------------------------------------------------------------------- #
+# Queue fan-out                                                                #
+# --------------------------------------------------------------------------- #
+
+class TestRunFanout(unittest.IsolatedAsyncioTestCase):
+    async def test_every_queue_receives_the_same_events(self):
+        participants = make_participants(2)
+        tournament = KnockoutTournament(draw_handling="seed")
+        queues = [asyncio.Queue(maxsize=FANOUT_QUEUE_SIZE) for _ in range(2)]
+
+        async def drain(q):
+            received = []
+            while (event := await q.get()) is not None:
+                received.append(event)
+            return received
+
+        _, first, second = await asyncio.gather(
+            tournament.run_fanout(participants, FAST_GAME_CONFIG, mock_player_factory, queues),
+            drain(queues[0]),
+            drain(queues[1]),
+        )
+
+        self.assertEqual(first, second)
+        self.assertIsInstance(first[0], TournamentStartEvent)
+        self.assertIsInstance(first[-1], TournamentCompleteEvent)
+
+    async def test_cancel_ends_run_while_a_consumer_is_stalled(self):
+        participants = make_participants(4)
+        tournament = KnockoutTournament(draw_handling="seed")
+        stalled = asyncio.Queue(maxsize=1)
+        live: asyncio.Queue = asyncio.Queue()
+
+        run = asyncio.create_task(
+            tournament.run_fanout(participants, FAST_GAME_CONFIG, mock_player_factory, [stalled, live])
+        )
+        await live.get()
+        await asyncio.sleep(0)  # let run_fanout block on the full queue
+        run.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await asyncio.wait_for(run, timeout=1)
+
+        self.assertIsNone(stalled.get_nowait())
+        remaining = [live.get_nowait() for _ in range(live.qsize())]
+        self.assertIsNone(remaining[-1])
+
 
 # --------------------------------------------------------------------------- #
 # Minimum participants validation                                              #
@@ -306,3 +385,53 @@ class TestParticipantHashability:
         p1 = make_participant("Alpha", 1)
         p2 = make_participant("Alpha", 2)
         assert p1 != p2
+
+
+# --------------------------------------------------------------------------- #
+# Incremental standings                                                       #
+# --------------------------------------------------------------------------- #
+
+class TestIncrementalStandings:
+    def _result(self, match_id, white, black, winner):
+        return MatchResult(
+            match_id=match_id,
+            white=white,
+            black=black,
+            game_result="1/2-1/2" if winner is None else ("1-0" if winner is white else "0-1"),
+            pgn="",
+            total_moves=0,
+            winner=winner,
+        )
+
+    def test_standings_stay_sorted_by_points_then_seed(self):
+        a, b, c, d = make_participants(4)
+        tournament = KnockoutTournament()
+        tournament._init_standings([a, b, c, d])
+
+        tournament.update_match(self._result("M1", d, a, d))
+        tournament.update_match(self._result("M2", b, c, None))
+
+        ranked = [e.participant for e in tournament.standings()]
+        assert ranked == [d, b, c, a]
+        assert tournament.standings()[0].points == 1.0
+
+    def test_bye_only_credits_the_advancing_participant(self):
+        a, b = make_participants(2)
+        tournament = KnockoutTournament()
+        tournament._init_standings([a, b])
+
+        tournament.update_match(self._result("M1", a, a, a))
+
+        by_name = {e.participant.display_name: e for e in tournament.standings()}
+        assert (by_name["Alpha"].wins, by_name["Alpha"].losses) == (1, 0)
+        assert by_name["Bravo"].games_played == 0
+
+
+class TestMatchResultIdentity:
+    def test_results_are_keyed_by_match_id(self):
+        a, b = make_participants(2)
+        draw = MatchResult("F", a, b, "1/2-1/2", "", 0, None)
+        decided = MatchResult("F", b, a, "1-0", "", 1, b)
+        assert draw == decided
+        assert len({draw, decided}) == 1
+        assert draw != MatchResult("SF-1", a, b, "1/2-1/2", "", 0, None)
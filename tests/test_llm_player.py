@@ -1,7 +1,10 @@
 import asyncio
+import tempfile
 import unittest
+from pathlib import Path
 
 from chessharness.players.base import GameState
+from chessharness.players.human import HumanPlayer
 from chessharness.players.llm import LLMPlayer
 from chessharness.providers.base import LLMProvider, Message
 
@@ -161,6 +164,16 @@ class LLMPlayerTests(unittest.IsolatedAsyncioTestCase):
         self.assertIn("Position (FEN)", user.content)
         self.assertIn("ASCII-BOARD", user.content)
 
+    def test_only_llm_players_start_conversation_logs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log_dir = Path(tmp)
+            HumanPlayer(name="Human").attach_conversation_log(log_dir, "g1", "white")
+            player = LLMPlayer(name="P", provider=_FakeProvider(supports_vision=False, chunks=[]))
+            player.attach_conversation_log(log_dir, "g1", "black")
+
+            self.assertIsNotNone(player._logger)
+            self.assertEqual([p.name for p in log_dir.iterdir()], ["game_g1_black_P.log"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -65,6 +65,17 @@ def _make_replay_log():
     return [start, game_start, move]
 
 
+def _frames(payloads):
+    """Encode payloads the way the broadcasters store them in replay logs."""
+    return [web_app._dumps_event(p) for p in payloads]
+
+
+def _receive_events(ws):
+    """Read one frame and return its events; replays arrive as one array frame."""
+    payload = ws.receive_json(mode="binary")
+    return payload if isinstance(payload, list) else [payload]
+
+
 class TournamentReplayTests(unittest.TestCase):
 
     def test_late_subscriber_receives_full_replay(self):
@@ -74,12 +85,10 @@ class TournamentReplayTests(unittest.TestCase):
         """
         log = _make_replay_log()
 
-        with patch.object(web_app._tournament_broadcaster, '_tournament_log', list(log)):
+        with patch.object(web_app._tournament_broadcaster, '_tournament_log', _frames(log)):
             with TestClient(web_app.app) as client:
                 with client.websocket_connect("/ws/tournament") as ws:
-                    received = []
-                    for _ in range(len(log)):
-                        received.append(ws.receive_json())
+                    received = _receive_events(ws)
 
         self.assertEqual(len(received), 3)
         self.assertEqual(received[0]["type"], "TournamentStartEvent")
@@ -93,12 +102,11 @@ class TournamentReplayTests(unittest.TestCase):
         """
         log = _make_replay_log()
 
-        with patch.object(web_app._tournament_broadcaster, '_tournament_log', list(log)):
+        with patch.object(web_app._tournament_broadcaster, '_tournament_log', _frames(log)):
             with TestClient(web_app.app) as client:
                 with client.websocket_connect("/ws/tournament") as ws:
-                    ws.receive_json()   # TournamentStartEvent
-                    ws.receive_json()   # MatchGameEvent(GameStartEvent)
-                    move_payload = ws.receive_json()  # MatchGameEvent(MoveAppliedEvent)
+                    # TournamentStartEvent, MatchGameEvent(GameStartEvent), MatchGameEvent(MoveAppliedEvent)
+                    _start, _game_start, move_payload = _receive_events(ws)
 
         self.assertEqual(move_payload["type"], "MatchGameEvent")
         game_event = move_payload["game_event"]
@@ -130,13 +138,12 @@ class TournamentReplayTests(unittest.TestCase):
                 move_number=1,
             )
         )
-        game_log = {"r1-m1": [game_start, move]}
+        game_log = {"r1-m1": _frames([game_start, move])}
 
         with patch.object(web_app._tournament_broadcaster, '_game_log', game_log):
             with TestClient(web_app.app) as client:
                 with client.websocket_connect("/ws/tournament/game/r1-m1") as ws:
-                    evt1 = ws.receive_json()
-                    evt2 = ws.receive_json()
+                    evt1, evt2 = _receive_events(ws)
 
         self.assertEqual(evt1["type"], "GameStartEvent")
         self.assertEqual(evt2["type"], "MoveAppliedEvent")
@@ -180,12 +187,12 @@ class TournamentReplayTests(unittest.TestCase):
         }
 
         with (
-            patch.object(web_app._tournament_broadcaster, "_tournament_log", deque(truncated_log)),
+            patch.object(web_app._tournament_broadcaster, "_tournament_log", deque(_frames(truncated_log))),
             patch.object(web_app._tournament_broadcaster, "_tournament_state", snapshot_state),
         ):
             with TestClient(web_app.app) as client:
                 with client.websocket_connect("/ws/tournament") as ws:
-                    payload = ws.receive_json()
+                    payload = ws.receive_json(mode="binary")
 
         self.assertEqual(payload["type"], "TournamentSnapshotEvent")
         self.assertEqual(payload["status"], "running")
@@ -197,7 +204,7 @@ class TournamentReplayTests(unittest.TestCase):
         should bootstrap from snapshot.
         """
         truncated_game_log = {
-            "r1-m1": [
+            "r1-m1": _frames([
                 web_app._to_json_dict(
                     MoveAppliedEvent(
                         color="white",
@@ -211,7 +218,7 @@ class TournamentReplayTests(unittest.TestCase):
                         move_number=1,
                     )
                 )
-            ]
+            ])
         }
         snapshot_state = {
             "r1-m1": {
@@ -236,7 +243,7 @@ class TournamentReplayTests(unittest.TestCase):
         ):
             with TestClient(web_app.app) as client:
                 with client.websocket_connect("/ws/tournament/game/r1-m1") as ws:
-                    payload = ws.receive_json()
+                    payload = ws.receive_json(mode="binary")
 
         self.assertEqual(payload["type"], "GameSnapshotEvent")
         self.assertEqual(payload["fen"], "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq d3 0 1")
@@ -286,6 +293,84 @@ class TournamentReplayTests(unittest.TestCase):
         self.assertEqual(match["plies"], ["e4"])
 
 
+class BroadcastFanoutTests(unittest.TestCase):
+
+    def test_live_subscribers_share_one_encoded_payload(self):
+        async def run():
+            broadcaster = web_app._TournamentBroadcaster()
+            first, second = broadcaster.subscribe(), broadcaster.subscribe()
+            payload = _make_replay_log()[0]
+            await broadcaster._broadcast_all(payload)
+            return payload, first.get_nowait(), second.get_nowait(), broadcaster.replay_log()
+
+        payload, sent_a, sent_b, replay = asyncio.run(run())
+        self.assertIs(sent_a, sent_b)
+        self.assertEqual(json.loads(sent_a)["participant_names"], payload["participant_names"])
+        self.assertEqual(replay, [sent_a])
+
+    def test_unsubscribe_is_idempotent_and_drops_empty_game_sets(self):
+        async def run():
+            broadcaster = web_app._TournamentBroadcaster()
+            q = broadcaster.subscribe()
+            gq = broadcaster.subscribe_game("R1-M1")
+            broadcaster.unsubscribe(q)
+            broadcaster.unsubscribe(q)
+            broadcaster.unsubscribe_game("R1-M1", gq)
+            broadcaster.unsubscribe_game("R1-M1", gq)
+            return broadcaster
+
+        broadcaster = asyncio.run(run())
+        self.assertEqual(broadcaster._all_subs, set())
+        self.assertNotIn("R1-M1", broadcaster._game_subs)
+
+    def test_overflowing_subscriber_is_resynced_with_snapshot(self):
+        async def run():
+            broadcaster = web_app._TournamentBroadcaster()
+            slow: asyncio.Queue = asyncio.Queue(maxsize=1)
+            broadcaster._all_subs.add(slow)
+            for payload in _make_replay_log():
+                await broadcaster._broadcast_all(payload)
+            return [slow.get_nowait() for _ in range(slow.qsize())]
+
+        received = asyncio.run(run())
+        self.assertEqual(len(received), 1)
+        snapshot = json.loads(received[0])
+        self.assertEqual(snapshot["type"], "TournamentSnapshotEvent")
+        self.assertEqual(snapshot["status"], "running")
+
+    def test_pump_sends_queued_backlog_as_one_array_frame(self):
+        class _Closed(Exception):
+            pass
+
+        class FakeSocket:
+            def __init__(self):
+                self.sent = []
+
+            async def send_bytes(self, data):
+                self.sent.append(data)
+                if len(self.sent) == 2:
+                    raise _Closed
+
+        async def run():
+            ws = FakeSocket()
+            q: asyncio.Queue = asyncio.Queue()
+            for frame in _frames(_make_replay_log()):
+                q.put_nowait(frame)
+            pump = asyncio.create_task(web_app._pump_frames(ws, q))
+            await asyncio.sleep(0)
+            q.put_nowait(web_app._dumps_event({"type": "error", "message": "x"}))
+            with self.assertRaises(_Closed):
+                await pump
+            return ws.sent
+
+        first, second = asyncio.run(run())
+        self.assertEqual(
+            [e["type"] for e in json.loads(first)],
+            ["TournamentStartEvent", "MatchGameEvent", "MatchGameEvent"],
+        )
+        self.assertEqual(json.loads(second), {"type": "error", "message": "x"})
+
+
 class SingleGameReplayTests(unittest.TestCase):
 
     def test_single_game_resume_replays_full_log(self):
@@ -305,19 +390,35 @@ class SingleGameReplayTests(unittest.TestCase):
                 move_number=1,
             )
         )
-        replay_log = deque([game_start, move])
+        replay_log = deque(_frames([game_start, move]))
 
         with patch.object(web_app._single_game_broadcaster, "_log", replay_log):
             with TestClient(web_app.app) as client:
                 with client.websocket_connect("/ws/game") as ws:
                     ws.send_json({"type": "resume"})
-                    evt1 = ws.receive_json()
-                    evt2 = ws.receive_json()
+                    evt1, evt2 = _receive_events(ws)
 
         self.assertEqual(evt1["type"], "GameStartEvent")
         self.assertEqual(evt2["type"], "MoveAppliedEvent")
         self.assertEqual(evt2["move_uci"], "e2e4")
 
+    def test_single_game_accepts_binary_commands(self):
+        game_start = web_app._to_json_dict(
+            GameStartEvent(white_name="Alpha", black_name="Bravo")
+        )
+        replay_log = deque(_frames([game_start]))
+
+        with patch.object(web_app._single_game_broadcaster, "_log", replay_log):
+            with TestClient(web_app.app) as client:
+                with client.websocket_connect("/ws/game") as ws:
+                    ws.send_json({"type": "resume"}, mode="binary")
+                    (evt,) = _receive_events(ws)
+                    ws.send_bytes(b'{"type": "submit_move", "move": "e4"}')
+                    error = ws.receive_json(mode="binary")
+
+        self.assertEqual(evt["type"], "GameStartEvent")
+        self.assertEqual(error, {"type": "error", "message": "No active game."})
+
     def test_single_game_resume_uses_snapshot_when_root_evicted(self):
         move = web_app._to_json_dict(
             MoveAppliedEvent(
@@ -348,13 +449,13 @@ class SingleGameReplayTests(unittest.TestCase):
         }
 
         with (
-            patch.object(web_app._single_game_broadcaster, "_log", deque([move])),
+            patch.object(web_app._single_game_broadcaster, "_log", deque(_frames([move]))),
             patch.object(web_app._single_game_broadcaster, "_state", snapshot_state),
         ):
             with TestClient(web_app.app) as client:
                 with client.websocket_connect("/ws/game") as ws:
                     ws.send_json({"type": "resume"})
-                    payload = ws.receive_json()
+                    payload = ws.receive_json(mode="binary")
 
         self.assertEqual(payload["type"], "GameSnapshotEvent")
         self.assertEqual(payload["fen"], "rnbqkbnr/pppppppp/8/8/3P4/8/PPP1PPPP/RNBQKBNR b KQkq d3 0 1")
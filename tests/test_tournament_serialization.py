@@ -82,6 +82,23 @@ class ToJsonDictTests(unittest.TestCase):
         self.assertIsInstance(result["pair"], list)
         self.assertEqual(result["pair"][0]["type"], "_Inner")
 
+    def test_underscore_fields_skipped_and_field_names_cached(self):
+        @dataclasses.dataclass(frozen=True)
+        class _Hidden:
+            shown: int
+            _cache: int = 0
+        result = web_app._to_json_dict(_Hidden(shown=3, _cache=7))
+        self.assertEqual(result, {"type": "_Hidden", "shown": 3})
+        names, getter = web_app._FIELDS_CACHE[_Hidden]
+        self.assertEqual(names, ("shown",))
+        self.assertEqual(getter(_Hidden(shown=4)), (4,))
+
+    def test_dataclass_without_public_fields(self):
+        @dataclasses.dataclass(frozen=True)
+        class _Empty:
+            _cache: int = 0
+        self.assertEqual(web_app._to_json_dict(_Empty()), {"type": "_Empty"})
+
     # ── Real event types ──────────────────────────────────────────────────
 
     def test_match_game_event_game_event_has_type(self):
@@ -132,3 +149,18 @@ class ToJsonDictTests(unittest.TestCase):
         self.assertEqual(result["total_rounds"], 1)
         # timestamp should be present (serialised by json.dumps default=str later)
         self.assertIn("timestamp", result)
+
+    def test_event_payload_matches_asdict_without_copying(self):
+        from chessharness.events import TurnStartEvent
+        evt = TurnStartEvent(
+            color="white",
+            player_name="Alpha",
+            move_number=1,
+            fen="start",
+            board_ascii="",
+            legal_moves_san=["e4", "d4"],
+            move_history_san=[],
+        )
+        result = web_app._event_payload(evt)
+        self.assertEqual(result, {"type": "TurnStartEvent", **dataclasses.asdict(evt)})
+        self.assertIs(result["legal_moves_san"], evt.legal_moves_san)
@@ -1,3 +1,5 @@
+import asyncio
+import json
 import unittest
 from unittest.mock import patch
 
@@ -27,6 +29,274 @@ class WebProviderOverridesTests(unittest.TestCase):
         self.assertEqual(providers["openai"].auth_token, "bearer-123")
         self.assertEqual(providers["openai"].models[0].id, "gpt-5")
 
+    def test_provider_overrides_rebuilt_only_after_auth_change(self) -> None:
+        cfg = Config(
+            game=GameConfig(),
+            providers={"openai": ProviderConfig(models=[ModelEntry(id="gpt-5", name="GPT-5")])},
+        )
+        tokens = {"openai": "old"}
+        with patch.object(web_app, "config", cfg), patch.object(
+            web_app, "auth_tokens", tokens
+        ), patch.object(web_app, "save_auth_tokens", lambda _tokens: None):
+            first = web_app._providers_with_auth_overrides()
+            self.assertIs(web_app._providers_with_auth_overrides(), first)
+
+            tokens["openai"] = "new"
+            web_app._save_auth_tokens()
+            second = web_app._providers_with_auth_overrides()
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second["openai"].auth_token, "new")
+        self.assertEqual(cfg.providers["openai"].auth_token, "")
+
+    def test_auth_token_saves_are_batched_off_the_loop(self) -> None:
+        writes = []
+        tokens: dict[str, str] = {}
+
+        async def run():
+            for i in range(3):
+                tokens["openai"] = f"tok-{i}"
+                web_app._save_auth_tokens()
+            self.assertEqual(writes, [])
+            await web_app._flush_auth_tokens()
+
+        with patch.object(web_app, "auth_tokens", tokens), patch.object(
+            web_app, "save_auth_tokens", writes.append
+        ), patch.object(web_app, "_AUTH_SAVE_DELAY", 0):
+            asyncio.run(run())
+
+        self.assertEqual(writes, [{"openai": "tok-2"}])
+
+    def test_get_models_is_cached_until_invalidated(self) -> None:
+        cfg = Config(
+            game=GameConfig(),
+            providers={
+                "openai": ProviderConfig(
+                    models=[ModelEntry(id="gpt-5", name="GPT-5", supports_vision=True)],
+                )
+            },
+        )
+        with patch.object(web_app, "config", cfg), patch.object(
+            web_app, "auth_tokens", {}
+        ), patch.object(web_app, "_models_body", None):
+            first = web_app.get_models().body
+            self.assertIs(web_app.get_models().body, first)
+            self.assertEqual([m["id"] for m in json.loads(first)], ["gpt-5"])
+
+            web_app._invalidate_models_cache()
+            self.assertIsNot(web_app.get_models().body, first)
+
+    def test_get_config_serves_cached_json(self) -> None:
+        cfg = Config(game=GameConfig(max_retries=5), providers={})
+        with patch.object(web_app, "config", cfg), patch.object(web_app, "_config_body", None):
+            first = web_app.get_config()
+            self.assertEqual(json.loads(first.body)["max_retries"], 5)
+            self.assertEqual(first.media_type, "application/json")
+            self.assertIs(web_app.get_config().body, first.body)
+
+    def test_verify_token_dedupes_and_caches_probes(self) -> None:
+        calls = []
+
+        async def fake_probe(name, prov):
+            calls.append(name)
+            await asyncio.sleep(0)
+            return True, None, None
+
+        providers_cfg = {"openai": ProviderConfig(bearer_token="sk-test-0123456789abcdef")}
+
+        async def run():
+            first = await asyncio.gather(
+                web_app._verify_token_detailed("openai", providers_cfg),
+                web_app._verify_token_detailed("openai", providers_cfg),
+            )
+            again = await web_app._verify_token_detailed("openai", providers_cfg)
+            web_app._invalidate_verify_cache("openai")
+            await web_app._verify_token_detailed("openai", providers_cfg)
+            return first, again
+
+        with patch.object(web_app, "_probe_token", fake_probe), patch.object(
+            web_app, "_verify_cache", {}
+        ):
+            first, again = asyncio.run(run())
+
+        self.assertEqual(first, [(True, None, None)] * 2)
+        self.assertEqual(again, (True, None, None))
+        self.assertEqual(calls, ["openai", "openai"])
+
+    def test_verify_probes_are_bounded(self) -> None:
+        running = []
+        peak = []
+
+        async def fake_probe(name, prov):
+            running.append(name)
+            peak.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(name)
+            return True, None, None
+
+        providers_cfg = {
+            f"p{i}": ProviderConfig(bearer_token=f"sk-test-{i}-0123456789abcdef") for i in range(5)
+        }
+
+        async def run():
+            await asyncio.gather(
+                *(web_app._verify_token_detailed(name, providers_cfg) for name in providers_cfg)
+            )
+
+        with patch.object(web_app, "_probe_token", fake_probe), patch.object(
+            web_app, "_verify_cache", {}
+        ), patch.object(web_app, "_verify_slots", asyncio.Semaphore(2)):
+            asyncio.run(run())
+
+        self.assertEqual(len(peak), 5)
+        self.assertEqual(max(peak), 2)
+
+    def test_connect_skips_reverifying_the_stored_token(self) -> None:
+        calls = []
+        writes = []
+        tokens: dict[str, str] = {}
+
+        async def fake_probe(name, prov):
+            calls.append(name)
+            return True, None, None
+
+        async def run():
+            payload = {"provider": "openai", "token": "sk-test-0123456789abcdef"}
+            for extra in ({}, {}, {"force": True}):
+                result = await web_app.connect_auth({**payload, **extra})
+                self.assertTrue(result["connected"])
+            await web_app._flush_auth_tokens()
+
+        with patch.object(web_app, "config", Config(game=GameConfig(), providers={})), patch.object(
+            web_app, "auth_tokens", tokens
+        ), patch.object(web_app, "save_auth_tokens", writes.append), patch.object(
+            web_app, "_AUTH_SAVE_DELAY", 0
+        ), patch.object(web_app, "_probe_token", fake_probe), patch.object(
+            web_app, "_verify_cache", {}
+        ), patch.object(web_app, "_models_body", None):
+            asyncio.run(run())
+
+        self.assertEqual(calls, ["openai", "openai"])
+        self.assertEqual(writes[-1], {"openai": "sk-test-0123456789abcdef"})
+
+    def test_provider_list_reports_tokens_and_verify_probes_on_demand(self) -> None:
+        calls = []
+
+        async def fake_probe(name, prov):
+            calls.append(name)
+            return True, None, None
+
+        cfg = Config(game=GameConfig(), providers={"openai": ProviderConfig()})
+
+        async def run():
+            await web_app.verify_auth_provider("openai")
+            return await web_app.verify_auth_provider("openai")
+
+        with patch.object(web_app, "config", cfg), patch.object(
+            web_app, "auth_tokens", {"openai": "sk-test-0123456789abcdef"}
+        ), patch.object(web_app, "_probe_token", fake_probe), patch.object(
+            web_app, "_verify_cache", {}
+        ):
+            rows = web_app.get_auth_providers()
+            self.assertEqual(calls, [])
+            result = asyncio.run(run())
+
+        self.assertIn({"provider": "openai", "connected": True}, rows)
+        self.assertIn({"provider": "anthropic", "connected": False}, rows)
+        self.assertEqual(result, {"provider": "openai", "connected": True})
+        self.assertEqual(calls, ["openai", "openai"])
+
+    def test_chatgpt_refresher_only_saves_when_codex_token_changes(self) -> None:
+        tokens = {"openai_chatgpt": "tok-a", "openai_chatgpt__source": "codex_auth"}
+        codex_token = ["tok-a"]
+        refresher = web_app._make_openai_chatgpt_token_refresher()
+
+        async def refresh_twice():
+            first = await refresher()
+            version = web_app._auth_version
+            codex_token[0] = "tok-b"
+            second = await refresher()
+            await web_app._flush_auth_tokens()
+            return first, version, second
+
+        with patch.object(web_app, "auth_tokens", tokens), patch.object(
+            web_app, "save_auth_tokens", lambda data: None
+        ), patch.object(web_app, "_AUTH_SAVE_DELAY", 0), patch.object(
+            web_app, "_auth_version", 0
+        ), patch.object(web_app, "_load_codex_auth_payload", lambda: {}), patch.object(
+            web_app, "_extract_codex_openai_token", lambda payload: codex_token[0]
+        ):
+            first, version, second = asyncio.run(refresh_twice())
+            self.assertEqual(web_app._auth_version, 1)
+
+        self.assertEqual((first, version, second), ("tok-a", 0, "tok-b"))
+        self.assertEqual(tokens["openai_chatgpt"], "tok-b")
+
+    def test_canonical_provider_name_maps_legacy_ids(self) -> None:
+        self.assertEqual(web_app._canonical_provider_name("copilot"), "copilot_chat")
+        self.assertEqual(web_app._canonical_provider_name("codex"), "openai_chatgpt")
+        self.assertEqual(web_app._canonical_provider_name("openai"), "openai")
+        self.assertNotIn("copilot", web_app._ALL_PROVIDER_NAMES)
+        self.assertEqual(list(web_app._ALL_PROVIDER_NAMES), sorted(web_app._ALL_PROVIDER_NAMES))
+
+    def test_verify_token_rejects_malformed_tokens_without_probing(self) -> None:
+        async def fail_probe(name, prov):
+            raise AssertionError("malformed tokens must not reach the network")
+
+        providers_cfg = {
+            "anthropic": ProviderConfig(api_key="sk-proj-0123456789abcdefghij"),
+            "google": ProviderConfig(api_key="AIza 0123456789abcdefghij"),
+        }
+        with patch.object(web_app, "_probe_token", fail_probe):
+            for name in providers_cfg:
+                ok, kind, _detail = asyncio.run(
+                    web_app._verify_token_detailed(name, providers_cfg)
+                )
+                self.assertFalse(ok)
+                self.assertEqual(kind, "auth")
+
+    def test_short_openai_compatible_keys_still_reach_the_probe(self) -> None:
+        calls = []
+
+        async def fake_probe(name, prov):
+            calls.append((name, prov.auth_token))
+            return True, None, None
+
+        providers_cfg = {"kimi": ProviderConfig(api_key="ollama", base_url="http://localhost:11434/v1")}
+        with patch.object(web_app, "_probe_token", fake_probe), patch.object(
+            web_app, "_verify_cache", {}
+        ):
+            result = asyncio.run(web_app._verify_token_detailed("kimi", providers_cfg))
+
+        self.assertEqual(result, (True, None, None))
+        self.assertEqual(calls, [("kimi", "ollama")])
+
+    def test_sdk_client_cache_is_lru_and_closes_dropped_clients(self) -> None:
+        class FakeClient:
+            def __init__(self) -> None:
+                self.closed = False
+
+            async def close(self) -> None:
+                self.closed = True
+
+        async def run():
+            a = web_app._sdk_client(("openai", "a"), FakeClient)
+            b = web_app._sdk_client(("openai", "b"), FakeClient)
+            self.assertIs(web_app._sdk_client(("openai", "a"), FakeClient), a)
+            web_app._sdk_client(("openai", "c"), FakeClient)  # evicts b, not a
+            web_app._drop_sdk_clients("a")
+            await asyncio.gather(*web_app._sdk_client_closers)
+            return a, b
+
+        with patch.object(web_app, "_sdk_clients", {}), patch.object(
+            web_app, "_SDK_CLIENT_CACHE_MAX", 2
+        ):
+            a, b = asyncio.run(run())
+            self.assertEqual(list(web_app._sdk_clients), [("openai", "c")])
+
+        self.assertTrue(b.closed)
+        self.assertTrue(a.closed)
+
     def test_find_model_entry_returns_exact_match(self) -> None:
         providers_cfg = {
             "google": ProviderConfig(
@@ -45,3 +315,30 @@ class WebProviderOverridesTests(unittest.TestCase):
         self.assertEqual(found.name, "Gemini 3 Flash")
         self.assertTrue(found.supports_vision)
 
+    def test_parse_timestamp_utc_accepts_zulu_and_epoch_ms(self) -> None:
+        zulu = web_app._parse_timestamp_utc("2026-01-01T00:00:00Z")
+        self.assertEqual(zulu, web_app._parse_timestamp_utc("2026-01-01T00:00:00+00:00"))
+        self.assertEqual(
+            web_app._parse_timestamp_utc(1_700_000_000_000),
+            web_app._parse_timestamp_utc(1_700_000_000),
+        )
+        self.assertIsNone(web_app._parse_timestamp_utc("not a date"))
+
+    def test_apply_ui_game_settings_coerces_and_filters(self) -> None:
+        cfg = Config(game=GameConfig(reasoning_effort="high"), providers={})
+        with patch.object(web_app, "config", cfg):
+            self.assertIs(web_app._apply_ui_game_settings({}), cfg.game)
+            game_cfg = web_app._apply_ui_game_settings({
+                "max_retries": "0",
+                "show_legal_moves": 0,
+                "board_input": "braille",
+                "reasoning_effort": "auto",
+                "starting_fen": "  ",
+            })
+
+        self.assertEqual(game_cfg.max_retries, 1)
+        self.assertFalse(game_cfg.show_legal_moves)
+        self.assertEqual(game_cfg.board_input, cfg.game.board_input)
+        self.assertIsNone(game_cfg.reasoning_effort)
+        self.assertIsNone(game_cfg.starting_fen)
+
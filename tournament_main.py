@@ -6,7 +6,7 @@ Usage:
 
 Wires together:
     config → participant selector → tournament settings →
-    providers → player factory → tournament loop → CLI display
+    providers → player factory → tournament loop → CLI display + PGN files
 """
 
 from __future__ import annotations
@@ -14,6 +14,7 @@ from __future__ import annotations
 import asyncio
 import signal
 import sys
+from datetime import datetime
 from pathlib import Path
 
 from chessharness.cli.tournament_display import console, display_tournament_event
@@ -24,10 +25,10 @@ from chessharness.cli.tournament_selector import (
 from chessharness.config import load_config
 from chessharness.players import create_player
 from chessharness.players.base import Player
-from chessharness.providers import create_provider
-from chessharness.tournaments import create_tournament
-from chessharness.tournaments.base import PlayerFactory, TournamentParticipant
-from chessharness.tournaments.events import TournamentCompleteEvent
+from chessharness.providers import LLMProvider, create_provider
+from chessharness.tournaments import FANOUT_QUEUE_SIZE, create_tournament
+from chessharness.tournaments.base import MatchResult, PlayerFactory, TournamentParticipant
+from chessharness.tournaments.events import MatchCompleteEvent
 
 
 async def _main() -> None:
@@ -49,15 +50,21 @@ async def _main() -> None:
 
     # ── Build the player factory ─────────────────────────────────────── #
     # Called once per game so each game starts with a fresh LLMPlayer
-    # (no conversation history carried over between games).
+    # (no conversation history carried over between games).  Providers are
+    # reused per participant, who only ever plays one game at a time, so
+    # each model keeps its SDK client and connection pool across matches.
+
+    providers: dict[TournamentParticipant, LLMProvider] = {}
 
     def player_factory(participant: TournamentParticipant) -> Player:
-        provider = create_provider(
-            participant.provider_name,
-            participant.model.id,
-            config.providers,
-            supports_vision_override=participant.model.supports_vision,
-        )
+        provider = providers.get(participant)
+        if provider is None:
+            provider = providers[participant] = create_provider(
+                participant.provider_name,
+                participant.model.id,
+                config.providers,
+                supports_vision_override=participant.model.supports_vision,
+            )
         return create_player(
             participant.provider_name,
             participant.display_name,
@@ -76,24 +83,37 @@ async def _main() -> None:
         f"[bold]{len(participants)}[/] participants…[/]\n"
     )
 
-    async for event in tournament.run(participants, config, player_factory):
-        display_tournament_event(event)
-        if isinstance(event, TournamentCompleteEvent) and config.game.save_pgn:
-            _save_all_pgns(tournament, config)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    # Display and PGN saving read separate queues, so a slow disk write never
+    # holds up the live display (or the other way round).
+    async def show(q: asyncio.Queue) -> None:
+        while (event := await q.get()) is not None:
+            display_tournament_event(event)
+
+    async def save_pgns(q: asyncio.Queue) -> None:
+        while (event := await q.get()) is not None:
+            if isinstance(event, MatchCompleteEvent):
+                await asyncio.to_thread(_save_match_pgn, event.result, config, timestamp)
+
+    consumers = [show]
+    if config.game.save_pgn:
+        consumers.append(save_pgns)
+    queues = [asyncio.Queue(maxsize=FANOUT_QUEUE_SIZE) for _ in consumers]
+    await asyncio.gather(
+        tournament.run_fanout(participants, config, player_factory, queues),
+        *(consume(q) for consume, q in zip(consumers, queues)),
+    )
 
-def _save_all_pgns(tournament, config) -> None:
-    """Save each match PGN from the tournament to pgn_dir."""
-    from datetime import datetime
 
+def _save_match_pgn(result: MatchResult, config, timestamp: str) -> None:
+    """Save a decided match's PGN to pgn_dir as soon as it completes."""
+    if not result.pgn:
+        return
     pgn_dir = config.pgn_dir_path
     pgn_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    for i, result in enumerate(tournament._all_results, 1):
-        if result.pgn:
-            fname = pgn_dir / f"tournament_{timestamp}_match_{result.match_id.replace('/', '-')}.pgn"
-            fname.write_text(result.pgn, encoding="utf-8")
+    fname = pgn_dir / f"tournament_{timestamp}_match_{result.match_id.replace('/', '-')}.pgn"
+    fname.write_text(result.pgn, encoding="utf-8")
 
 
 def main() -> None:
@@ -8,6 +8,16 @@ Development (hot-reload):
 Production (serve built frontend):
     cd frontend && npm run build
     uv run python web_main.py       ← everything on :8000
+
+Event loop: uvicorn[standard] installs uvloop (except on Windows) and uvicorn's
+default loop="auto" picks it up, so the app already runs on uvloop where it
+is available.  Don't call uvloop.install() from app code — it fights with
+uvicorn's own loop setup and is deprecated on Python 3.12+.
+
+Workers: run a single process.  The running tournament or game, its replay
+logs, the WebSocket subscriber queues and the auth token store all live in
+this process's memory, so a second worker would see none of them.  One
+process keeps up because each event is encoded once for every viewer.
 """
 
 import uvicorn